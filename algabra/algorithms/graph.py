@@ -1,14 +1,39 @@
 from __future__ import annotations
 
+import array
 import collections
 import enum
+import hashlib
+import math
+import multiprocessing
+import multiprocessing.shared_memory
+import struct
 import typing
 
+import numpy
+import scipy.sparse
+
 import algabra.datastructures.graph as mygraph
+import algabra.datastructures.heap as myheap
+
+TraversableGraph = typing.Union[mygraph.AdjacencyListGraph, mygraph.CSRGraph]
+RankMapping = typing.Mapping[mygraph.VertexKey, float]
+
+_shared_csr = dict()
+
+_HEAP_NODE_TYPES = [
+    (myheap.FibonacciHeap, myheap.FibonacciHeapNode),
+    (myheap.PairingHeap, myheap.PairingHeapNode),
+    (myheap.RadixHeap, myheap.RadixHeapNode),
+]
 
+_LANDMARKS_MAGIC = b'ALT2'
+_LANDMARKS_HEADER = struct.Struct('<4sqq16s')
 
-def breadth_first_search(graph: mygraph.AdjacencyListGraph,
-                         start_vertex: BFSVertex) -> None:
+
+def breadth_first_search(graph: TraversableGraph,
+                         start_vertex: BFSVertex,
+                         max_distance: typing.Optional[int] = None) -> None:
     start_vertex.color = Color.GREY
     start_vertex.distance = 0
 
@@ -17,20 +42,29 @@ def breadth_first_search(graph: mygraph.AdjacencyListGraph,
 
     while not search_queue.is_empty():
         vertex = search_queue.deque()
+        if max_distance is not None and vertex.distance >= max_distance:
+            vertex.color = Color.BLACK
+            continue
 
-        for edge in graph.get_edges(vertex):
-            if edge.get_vertex().color == Color.WHITE:
-                edge.get_vertex().color = Color.GREY
-                edge.get_vertex().distance = vertex.distance + 1
-                edge.get_vertex().predecessor = vertex
-                search_queue.queue(edge.get_vertex())
+        for adjacent in graph.get_adjacent(vertex):
+            if adjacent.color == Color.WHITE:
+                adjacent.color = Color.GREY
+                adjacent.distance = vertex.distance + 1
+                adjacent.predecessor = vertex
+                search_queue.queue(adjacent)
 
         vertex.color = Color.BLACK
 
 
-def shortest_path(graph: mygraph.AdjacencyListGraph, start_from: BFSVertex,
-                  to: BFSVertex) -> VertexStack:
-    breadth_first_search(graph, start_from)
+def shortest_path(graph: TraversableGraph,
+                  start_from: BFSVertex,
+                  to: BFSVertex,
+                  bidirectional: bool = False,
+                  max_hops: typing.Optional[int] = None) -> VertexStack:
+    if bidirectional:
+        return _bidirectional_path(graph, start_from, to, max_hops)
+
+    breadth_first_search(graph, start_from, max_hops)
     path = VertexStack()
 
     if to == start_from:
@@ -52,7 +86,76 @@ def shortest_path(graph: mygraph.AdjacencyListGraph, start_from: BFSVertex,
     return path
 
 
-def depth_first_search(graph: mygraph.AdjacencyListGraph,
+def _bidirectional_path(graph: mygraph.GraphInterface,
+                        start_from: mygraph.Vertex, to: mygraph.Vertex,
+                        max_hops: typing.Optional[int]) -> VertexStack:
+    path = VertexStack()
+    if to == start_from:
+        path.push(start_from)
+        return path
+
+    graph = graph.get_csr()
+    source = _require_index(graph, start_from)
+    target = _require_index(graph, to)
+    forward = array.array('q', [-1]) * len(graph)
+    backward = array.array('q', [-1]) * len(graph)
+    forward[source] = source
+    backward[target] = target
+    forward_frontier = array.array('q', [source])
+    backward_frontier = array.array('q', [target])
+    meeting = -1
+    hops = 0
+
+    while meeting < 0 and forward_frontier and backward_frontier:
+        if max_hops is not None and hops >= max_hops:
+            return path
+        hops += 1
+
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, meeting = _expand_frontier(
+                graph.get_offsets(), graph.get_targets(), forward_frontier,
+                forward, backward)
+        else:
+            backward_frontier, meeting = _expand_frontier(
+                graph.get_reverse_offsets(), graph.get_reverse_sources(),
+                backward_frontier, backward, forward)
+
+    if meeting >= 0:
+        vertices = graph.get_vertex_index().get_vertices()
+        tail = []
+        vertex = meeting
+        while vertex != target:
+            vertex = backward[vertex]
+            tail.append(vertex)
+        for vertex in reversed(tail):
+            path.push(vertices[vertex])
+
+        vertex = meeting
+        path.push(vertices[vertex])
+        while vertex != source:
+            vertex = forward[vertex]
+            path.push(vertices[vertex])
+
+    return path
+
+
+def _expand_frontier(offsets: typing.Sequence[int],
+                     neighbours: typing.Sequence[int], frontier: array.array,
+                     parents: array.array,
+                     others: array.array) -> typing.Tuple[array.array, int]:
+    next_frontier = array.array('q')
+    for vertex in frontier:
+        for neighbour in neighbours[offsets[vertex]:offsets[vertex + 1]]:
+            if parents[neighbour] < 0:
+                parents[neighbour] = vertex
+                if others[neighbour] >= 0:
+                    return next_frontier, neighbour
+                next_frontier.append(neighbour)
+
+    return next_frontier, -1
+
+
+def depth_first_search(graph: TraversableGraph,
                        vertex_visitor: typing.Optional[VertexVisitor] = None,
                        edge_visitor: typing.Optional[EdgeVisitor] = None
                        ) -> None:
@@ -90,13 +193,715 @@ def depth_first_search(graph: mygraph.AdjacencyListGraph,
             vertex_visitor.stop_visiting(ascendant)
 
 
-def topological_sort(graph: mygraph.AdjacencyListGraph) -> typing.List[int]:
+def topological_sort(graph: TraversableGraph) -> typing.List[int]:
     vertex_visitor = TopologicalSortVertexVisitor()
     edge_visitor = DAGEdgeVisitor()
     depth_first_search(graph, vertex_visitor, edge_visitor)
     return [vertex.get_key() for vertex in vertex_visitor.get_sorted()]
 
 
+def breadth_first_traversal(graph: mygraph.GraphInterface,
+                            start_vertex: mygraph.Vertex) -> SearchResult:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    distances = array.array('q', [-1]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+
+    source = _require_index(graph, start_vertex)
+    distances[source] = 0
+    search_queue = array.array('q', [source])
+    head = 0
+
+    while head < len(search_queue):
+        vertex = search_queue[head]
+        head += 1
+        distance = distances[vertex] + 1
+
+        for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+            if distances[target] < 0:
+                distances[target] = distance
+                parents[target] = vertex
+                search_queue.append(target)
+
+    return SearchResult(graph, distances, parents)
+
+
+def direction_optimizing_traversal(graph: mygraph.GraphInterface,
+                                   start_vertex: mygraph.Vertex,
+                                   alpha: float = 14,
+                                   beta: float = 24) -> SearchResult:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    reverse_offsets = graph.get_reverse_offsets()
+    sources = graph.get_reverse_sources()
+    distances = array.array('q', [-1]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+
+    source = _require_index(graph, start_vertex)
+    distances[source] = 0
+    frontier = [source]
+    unvisited = range(len(graph))
+    unexplored_edges = len(targets) - (offsets[source + 1] - offsets[source])
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        level += 1
+        if bottom_up:
+            bottom_up = len(frontier) * beta >= len(graph)
+        else:
+            frontier_edges = 0
+            for vertex in frontier:
+                frontier_edges += offsets[vertex + 1] - offsets[vertex]
+            bottom_up = frontier_edges * alpha > unexplored_edges
+
+        next_frontier = []
+        if bottom_up:
+            in_frontier = bytearray(len(graph))
+            for vertex in frontier:
+                in_frontier[vertex] = 1
+
+            unvisited = [
+                vertex for vertex in unvisited if distances[vertex] < 0
+            ]
+            for vertex in unvisited:
+                parents_begin = reverse_offsets[vertex]
+                parents_end = reverse_offsets[vertex + 1]
+                for parent in sources[parents_begin:parents_end]:
+                    if in_frontier[parent]:
+                        distances[vertex] = level
+                        parents[vertex] = parent
+                        next_frontier.append(vertex)
+                        break
+        else:
+            for vertex in frontier:
+                for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+                    if distances[target] < 0:
+                        distances[target] = level
+                        parents[target] = vertex
+                        next_frontier.append(target)
+
+        for vertex in next_frontier:
+            unexplored_edges -= offsets[vertex + 1] - offsets[vertex]
+        frontier = next_frontier
+
+    return SearchResult(graph, distances, parents)
+
+
+def parallel_breadth_first_traversal(graph: mygraph.GraphInterface,
+                                     start_vertex: mygraph.Vertex,
+                                     workers: typing.Optional[int] = None,
+                                     chunks_per_worker: int = 4
+                                     ) -> SearchResult:
+    graph = graph.get_csr()
+    workers = multiprocessing.cpu_count() if workers is None else workers
+    distances = array.array('q', [-1]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+
+    source = _require_index(graph, start_vertex)
+    distances[source] = 0
+    frontier = array.array('q', [source])
+
+    buffers = [
+        graph.get_offsets(),
+        graph.get_targets(),
+        array.array('B', [0]) * len(graph),
+    ]
+    blocks = [_share_buffer(buffer) for buffer in buffers]
+    descriptors = [(block.name, memoryview(buffer).format, len(buffer))
+                   for block, buffer in zip(blocks, buffers)]
+    visited = memoryview(blocks[2].buf)[:len(graph)]
+    visited[source] = 1
+
+    try:
+        with multiprocessing.Pool(workers, _attach_shared_csr,
+                                  (descriptors,)) as pool:
+            level = 0
+            while frontier:
+                level += 1
+                chunk_size = -(-len(frontier) // (workers * chunks_per_worker))
+                chunks = [
+                    frontier[first:first + chunk_size].tobytes()
+                    for first in range(0, len(frontier), chunk_size)
+                ]
+
+                frontier = array.array('q')
+                for discovered_bytes in pool.map(_expand_shared_chunk, chunks):
+                    discovered = array.array('q')
+                    discovered.frombytes(discovered_bytes)
+                    for position in range(0, len(discovered), 2):
+                        vertex = discovered[position]
+                        if not visited[vertex]:
+                            visited[vertex] = 1
+                            distances[vertex] = level
+                            parents[vertex] = discovered[position + 1]
+                            frontier.append(vertex)
+    finally:
+        visited.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    return SearchResult(graph, distances, parents)
+
+
+def _share_buffer(
+        buffer: array.array) -> multiprocessing.shared_memory.SharedMemory:
+    size = len(buffer) * buffer.itemsize
+    block = multiprocessing.shared_memory.SharedMemory(create=True,
+                                                       size=max(1, size))
+    block.buf[:size] = memoryview(buffer).cast('B')
+
+    return block
+
+
+def _attach_shared_csr(
+        descriptors: typing.List[typing.Tuple[str, str, int]]) -> None:
+    blocks = []
+    views = []
+    for name, typecode, length in descriptors:
+        block = multiprocessing.shared_memory.SharedMemory(name)
+        size = length * array.array(typecode).itemsize
+        blocks.append(block)
+        views.append(block.buf[:size].cast(typecode))
+
+    offsets, targets, visited = views
+    _shared_csr.update(blocks=blocks,
+                       offsets=offsets,
+                       targets=targets,
+                       visited=visited)
+
+
+def _expand_shared_chunk(frontier_bytes: bytes) -> bytes:
+    offsets = _shared_csr['offsets']
+    targets = _shared_csr['targets']
+    visited = _shared_csr['visited']
+    frontier = array.array('q')
+    frontier.frombytes(frontier_bytes)
+
+    seen = set()
+    discovered = array.array('q')
+    for vertex in frontier:
+        for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+            if not visited[target] and target not in seen:
+                seen.add(target)
+                discovered.append(target)
+                discovered.append(vertex)
+
+    return discovered.tobytes()
+
+
+def depth_first_traversal(graph: mygraph.GraphInterface
+                          ) -> DepthFirstSearchResult:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    begin = array.array('q', [-1]) * len(graph)
+    end = array.array('q', [-1]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+
+    order = 0
+    stack_vertices = array.array('q')
+    stack_positions = array.array('q')
+    for root in range(len(graph)):
+        if begin[root] >= 0:
+            continue
+
+        order += 1
+        begin[root] = order
+        stack_vertices.append(root)
+        stack_positions.append(offsets[root])
+
+        while stack_vertices:
+            vertex = stack_vertices[-1]
+            position = stack_positions[-1]
+            if position < offsets[vertex + 1]:
+                stack_positions[-1] = position + 1
+                target = targets[position]
+                if begin[target] < 0:
+                    order += 1
+                    begin[target] = order
+                    parents[target] = vertex
+                    stack_vertices.append(target)
+                    stack_positions.append(offsets[target])
+            else:
+                order += 1
+                end[vertex] = order
+                stack_vertices.pop()
+                stack_positions.pop()
+
+    return DepthFirstSearchResult(graph, begin, end, parents)
+
+
+def multi_source_traversal(
+        graph: mygraph.GraphInterface,
+        sources: typing.Sequence[mygraph.Vertex],
+        targets: typing.Optional[typing.Sequence[mygraph.Vertex]] = None,
+        batch_size: int = 256) -> typing.List[array.array]:
+    graph = graph.get_csr()
+    source_indices = [_require_index(graph, vertex) for vertex in sources]
+    target_indices = None
+    if targets is not None:
+        if len(targets) != len(sources):
+            raise ValueError('Expected %d targets, got %d' %
+                             (len(sources), len(targets)))
+        target_indices = [_require_index(graph, vertex) for vertex in targets]
+
+    rows = []
+    for first in range(0, len(source_indices), batch_size):
+        last = first + batch_size
+        rows.extend(
+            _multi_source_batch(
+                graph, source_indices[first:last],
+                None if target_indices is None else target_indices[first:last]))
+
+    return rows
+
+
+def _multi_source_batch(graph: mygraph.CSRGraph, sources: typing.List[int],
+                        targets: typing.Optional[typing.List[int]]
+                        ) -> typing.List[array.array]:
+    offsets, adjacent = graph.get_offsets(), graph.get_targets()
+    rows = [array.array('q', [-1]) * len(graph) for _ in sources]
+    seen = [0] * len(graph)
+    visit = dict()
+    for bit, source in enumerate(sources):
+        seen[source] |= 1 << bit
+        visit[source] = visit.get(source, 0) | 1 << bit
+        rows[bit][source] = 0
+
+    active = (1 << len(sources)) - 1
+    waiting = dict()
+    if targets is not None:
+        for bit, target in enumerate(targets):
+            waiting[target] = waiting.get(target, 0) | 1 << bit
+        active = _finish_reached(seen, waiting, active)
+
+    level = 0
+    while visit and active:
+        level += 1
+        next_visit = dict()
+        for vertex, mask in visit.items():
+            mask &= active
+            if not mask:
+                continue
+
+            for target in adjacent[offsets[vertex]:offsets[vertex + 1]]:
+                discovered = mask & ~seen[target]
+                if discovered:
+                    seen[target] |= discovered
+                    next_visit[target] = next_visit.get(target, 0) | discovered
+
+        for vertex, mask in next_visit.items():
+            while mask:
+                lowest = mask & -mask
+                rows[lowest.bit_length() - 1][vertex] = level
+                mask ^= lowest
+
+        if waiting:
+            active = _finish_reached(seen, waiting, active)
+        visit = next_visit
+
+    return rows
+
+
+def _finish_reached(seen: typing.List[int], waiting: typing.Dict[int, int],
+                    active: int) -> int:
+    for target, mask in list(waiting.items()):
+        reached = seen[target] & mask
+        if reached:
+            active &= ~reached
+            if reached == mask:
+                del waiting[target]
+            else:
+                waiting[target] = mask & ~reached
+
+    return active
+
+
+def dijkstra(graph: mygraph.GraphInterface,
+             start_vertex: mygraph.Vertex,
+             heap_type: typing.Type[myheap.AbstractHeap] = myheap.IndexedMinHeap
+             ) -> SearchResult:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    weights = graph.get_weights()
+    if weights is not None and weights and min(weights) < 0:
+        raise ValueError('Dijkstra requires non-negative edge weights')
+
+    distances = array.array('d', [-1]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+    settled = bytearray(len(graph))
+
+    source = _require_index(graph, start_vertex)
+    distances[source] = 0
+    queue = _create_priority_queue(heap_type)
+    queue.push(source, 0)
+
+    while queue:
+        vertex, distance = queue.pop()
+        settled[vertex] = 1
+
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            target = targets[position]
+            if settled[target]:
+                continue
+
+            candidate = distance + (1 if weights is None else weights[position])
+            if distances[target] < 0:
+                distances[target] = candidate
+                parents[target] = vertex
+                queue.push(target, candidate)
+            elif candidate < distances[target]:
+                distances[target] = candidate
+                parents[target] = vertex
+                queue.promote(target, candidate)
+
+    return SearchResult(graph, distances, parents)
+
+
+def prim(graph: mygraph.GraphInterface,
+         heap_type: typing.Type[myheap.AbstractHeap] = myheap.IndexedMinHeap
+         ) -> typing.List[typing.Tuple[mygraph.Vertex, mygraph.Vertex, float]]:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    weights = graph.get_weights()
+
+    costs = array.array('d', [0]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+    queued = bytearray(len(graph))
+    in_tree = bytearray(len(graph))
+    tree = []
+
+    for root in range(len(graph)):
+        if queued[root]:
+            continue
+
+        queue = _create_priority_queue(heap_type)
+        queue.push(root, 0)
+        queued[root] = 1
+
+        while queue:
+            vertex, cost = queue.pop()
+            in_tree[vertex] = 1
+            if parents[vertex] >= 0:
+                tree.append((graph.get_vertex_at(parents[vertex]),
+                             graph.get_vertex_at(vertex), cost))
+
+            for position in range(offsets[vertex], offsets[vertex + 1]):
+                target = targets[position]
+                if in_tree[target]:
+                    continue
+
+                weight = 1 if weights is None else weights[position]
+                if not queued[target]:
+                    queued[target] = 1
+                    costs[target] = weight
+                    parents[target] = vertex
+                    queue.push(target, weight)
+                elif weight < costs[target]:
+                    costs[target] = weight
+                    parents[target] = vertex
+                    queue.promote(target, weight)
+
+    return tree
+
+
+def a_star(graph: mygraph.GraphInterface,
+           start_vertex: mygraph.Vertex,
+           to: mygraph.Vertex,
+           landmarks: typing.Optional[LandmarkIndex] = None,
+           heap_type: typing.Type[myheap.AbstractHeap] = myheap.IndexedMinHeap
+           ) -> SearchResult:
+    graph = graph.get_csr()
+    if landmarks is not None:
+        _require_landmarks_graph(landmarks, graph)
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    weights = graph.get_weights()
+
+    distances = array.array('d', [-1]) * len(graph)
+    parents = array.array('q', [-1]) * len(graph)
+    settled = bytearray(len(graph))
+
+    source = _require_index(graph, start_vertex)
+    target = _require_index(graph, to)
+    if landmarks is None:
+        estimate = _zero_estimate
+    else:
+        estimate = landmarks._estimate
+
+    distances[source] = 0
+    queue = _create_priority_queue(heap_type)
+    queue.push(source, estimate(source, target))
+
+    while queue:
+        vertex, _ = queue.pop()
+        if vertex == target:
+            break
+        settled[vertex] = 1
+        distance = distances[vertex]
+
+        for position in range(offsets[vertex], offsets[vertex + 1]):
+            adjacent = targets[position]
+            if settled[adjacent]:
+                continue
+
+            candidate = distance + (1 if weights is None else weights[position])
+            if distances[adjacent] < 0:
+                distances[adjacent] = candidate
+                parents[adjacent] = vertex
+                queue.push(adjacent, candidate + estimate(adjacent, target))
+            elif candidate < distances[adjacent]:
+                distances[adjacent] = candidate
+                parents[adjacent] = vertex
+                queue.promote(adjacent,
+                              candidate + estimate(adjacent, target))
+
+    return SearchResult(graph, distances, parents)
+
+
+def _zero_estimate(vertex: int, target: int) -> float:
+    return 0
+
+
+def _create_priority_queue(heap_type: typing.Type[myheap.AbstractHeap]
+                           ) -> typing.Union[_IndexedPriorityQueue,
+                                             _NodePriorityQueue]:
+    for node_heap_type, node_type in _HEAP_NODE_TYPES:
+        if issubclass(heap_type, node_heap_type):
+            return _NodePriorityQueue(heap_type(), node_type)
+
+    return _IndexedPriorityQueue(heap_type())
+
+
+def strongly_connected_components(graph: mygraph.GraphInterface
+                                  ) -> StronglyConnectedComponents:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    indices = array.array('q', [-1]) * len(graph)
+    lows = array.array('q', [0]) * len(graph)
+    on_stack = bytearray(len(graph))
+    components = array.array(memoryview(targets).format, [-1]) * len(graph)
+
+    counter = 0
+    count = 0
+    stack = array.array('q')
+    call_vertices = array.array('q')
+    call_positions = array.array('q')
+    for root in range(len(graph)):
+        if indices[root] >= 0:
+            continue
+
+        indices[root] = lows[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        call_vertices.append(root)
+        call_positions.append(offsets[root])
+
+        while call_vertices:
+            vertex = call_vertices[-1]
+            position = call_positions[-1]
+            if position < offsets[vertex + 1]:
+                call_positions[-1] = position + 1
+                target = targets[position]
+                if indices[target] < 0:
+                    indices[target] = lows[target] = counter
+                    counter += 1
+                    stack.append(target)
+                    on_stack[target] = 1
+                    call_vertices.append(target)
+                    call_positions.append(offsets[target])
+                elif on_stack[target] and indices[target] < lows[vertex]:
+                    lows[vertex] = indices[target]
+                continue
+
+            call_vertices.pop()
+            call_positions.pop()
+            if lows[vertex] == indices[vertex]:
+                member = -1
+                while member != vertex:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    components[member] = count
+                count += 1
+
+            if call_vertices and lows[vertex] < lows[call_vertices[-1]]:
+                lows[call_vertices[-1]] = lows[vertex]
+
+    return StronglyConnectedComponents(graph, components, count)
+
+
+def page_rank(graph: mygraph.GraphInterface,
+              damping: float = 0.85,
+              tolerance: float = 1e-10,
+              max_iterations: int = 100,
+              personalization: typing.Optional[RankMapping] = None,
+              initial: typing.Optional[RankMapping] = None
+              ) -> PageRankResult:
+    if not 0 <= damping < 1:
+        raise ValueError('Damping must be in [0, 1), got %r' % damping)
+
+    graph = graph.get_csr()
+    count = len(graph)
+    if not count:
+        return PageRankResult(graph, numpy.zeros(0), 0, True)
+
+    offsets = numpy.frombuffer(graph.get_offsets(), dtype=numpy.int64)
+    targets = graph.get_targets()
+    targets = numpy.frombuffer(targets, dtype=memoryview(targets).format)
+    weights = graph.get_weights()
+    weights = numpy.ones(len(targets)) if weights is None else \
+        numpy.frombuffer(weights, dtype=numpy.float64)
+    if len(weights) and weights.min() < 0:
+        raise ValueError('PageRank does not support negative edge weights')
+
+    adjacency = scipy.sparse.csr_matrix((weights, targets, offsets),
+                                        shape=(count, count))
+    out_weights = numpy.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_weights == 0
+    scale = numpy.divide(1.0,
+                         out_weights,
+                         out=numpy.zeros(count),
+                         where=~dangling)
+    transposed = adjacency.T.tocsr()
+
+    teleport = _rank_vector(graph, personalization)
+    ranks = _rank_vector(graph, initial)
+    for iteration in range(1, max_iterations + 1):
+        previous = ranks
+        ranks = damping * transposed.dot(previous * scale)
+        ranks += (damping * previous[dangling].sum() + 1 - damping) * teleport
+        if numpy.abs(ranks - previous).sum() < tolerance:
+            return PageRankResult(graph, ranks, iteration, True)
+
+    return PageRankResult(graph, ranks, max_iterations, False)
+
+
+def _rank_vector(graph: mygraph.CSRGraph,
+                 values: typing.Optional[RankMapping]) -> numpy.ndarray:
+    if values is None:
+        return numpy.full(len(graph), 1 / len(graph))
+
+    vector = numpy.zeros(len(graph))
+    ids = graph.get_vertex_index().get_ids(values.keys())
+    for vertex_id, value in zip(ids, values.values()):
+        if vertex_id >= 0:
+            vector[vertex_id] = value
+
+    if vector.min() < 0 or not vector.sum() > 0:
+        raise ValueError('Rank values must be non-negative and cover at '
+                         'least one vertex of the graph')
+
+    return vector / vector.sum()
+
+
+def topological_order(
+        graph: mygraph.GraphInterface) -> typing.Iterator[mygraph.Vertex]:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    vertices = graph.get_vertex_index().get_vertices()
+    in_degrees = _get_in_degrees(graph)
+    ready = collections.deque(
+        vertex for vertex in range(len(graph)) if not in_degrees[vertex])
+
+    emitted = 0
+    while ready:
+        vertex = ready.popleft()
+        yield vertices[vertex]
+        emitted += 1
+
+        for adjacent in targets[offsets[vertex]:offsets[vertex + 1]]:
+            in_degrees[adjacent] -= 1
+            if not in_degrees[adjacent]:
+                ready.append(adjacent)
+
+    if emitted < len(graph):
+        raise CycleException(_find_cycle(graph, in_degrees))
+
+
+def topological_layers(graph: mygraph.GraphInterface
+                       ) -> typing.Iterator[typing.List[mygraph.Vertex]]:
+    graph = graph.get_csr()
+    offsets, targets = graph.get_offsets(), graph.get_targets()
+    vertices = graph.get_vertex_index().get_vertices()
+    in_degrees = _get_in_degrees(graph)
+    layer = [vertex for vertex in range(len(graph)) if not in_degrees[vertex]]
+
+    emitted = 0
+    while layer:
+        yield [vertices[vertex] for vertex in layer]
+        emitted += len(layer)
+
+        next_layer = []
+        for vertex in layer:
+            for adjacent in targets[offsets[vertex]:offsets[vertex + 1]]:
+                in_degrees[adjacent] -= 1
+                if not in_degrees[adjacent]:
+                    next_layer.append(adjacent)
+        layer = next_layer
+
+    if emitted < len(graph):
+        raise CycleException(_find_cycle(graph, in_degrees))
+
+
+def _get_in_degrees(graph: mygraph.CSRGraph) -> array.array:
+    in_degrees = array.array('q', [0]) * len(graph)
+    for target in graph.get_targets():
+        in_degrees[target] += 1
+
+    return in_degrees
+
+
+def _find_cycle(graph: mygraph.CSRGraph,
+                in_degrees: array.array) -> typing.List[mygraph.Vertex]:
+    offsets = graph.get_reverse_offsets()
+    sources = graph.get_reverse_sources()
+    vertex = next(vertex for vertex in range(len(graph))
+                  if in_degrees[vertex] > 0)
+    positions = array.array('q', [-1]) * len(graph)
+    walk = []
+    while positions[vertex] < 0:
+        positions[vertex] = len(walk)
+        walk.append(vertex)
+        vertex = next(predecessor for predecessor in
+                      sources[offsets[vertex]:offsets[vertex + 1]]
+                      if in_degrees[predecessor] > 0)
+
+    vertices = graph.get_vertex_index().get_vertices()
+    cycle = [vertices[vertex] for vertex in walk[positions[vertex]:]]
+    cycle.reverse()
+    cycle.append(cycle[0])
+
+    return cycle
+
+
+def _require_landmarks_graph(landmarks: LandmarkIndex,
+                             graph: mygraph.CSRGraph) -> None:
+    if landmarks.get_graph() is not graph and \
+            landmarks.get_fingerprint() != _graph_fingerprint(graph):
+        raise ValueError('Landmark index was built for a different graph')
+
+
+def _graph_fingerprint(graph: mygraph.CSRGraph) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack('<q', len(graph)))
+    for section in (graph.get_offsets(), graph.get_targets(),
+                    graph.get_weights()):
+        if section is not None:
+            digest.update(memoryview(section).cast('B'))
+        digest.update(b'\0')
+
+    return digest.digest()
+
+
+def _require_index(graph: mygraph.CSRGraph, vertex: mygraph.Vertex) -> int:
+    index = graph.get_index(vertex)
+    if index is None or graph.get_vertex_at(index) != vertex:
+        raise mygraph.WrongVertexException(vertex)
+
+    return index
+
+
 class Color(enum.Enum):
     WHITE = 1
     GREY = 2
@@ -133,6 +938,322 @@ class DFSVertex(mygraph.Vertex):
         self.color = color
 
 
+class SearchResult:
+    __slots__ = '_graph', '_distances', '_parents'
+
+    def __init__(self, graph: mygraph.CSRGraph, distances: array.array,
+                 parents: array.array) -> None:
+        self._graph = graph
+        self._distances = distances
+        self._parents = parents
+
+    def get_distance(self, vertex: mygraph.Vertex
+                     ) -> typing.Union[int, float, None]:
+        index = self._graph.get_index(vertex)
+        if index is None or self._distances[index] < 0:
+            return None
+
+        return self._distances[index]
+
+    def get_predecessor(self, vertex: mygraph.Vertex
+                        ) -> typing.Optional[mygraph.Vertex]:
+        index = self._graph.get_index(vertex)
+        if index is None or self._parents[index] < 0:
+            return None
+
+        return self._graph.get_vertex_at(self._parents[index])
+
+    def get_path(self, to: mygraph.Vertex) -> VertexStack:
+        path = VertexStack()
+        index = self._graph.get_index(to)
+        if index is None or self._distances[index] < 0:
+            return path
+
+        while index >= 0:
+            path.push(self._graph.get_vertex_at(index))
+            index = self._parents[index]
+
+        return path
+
+    def get_distances(self) -> array.array:
+        return self._distances
+
+    def get_parents(self) -> array.array:
+        return self._parents
+
+
+class DepthFirstSearchResult:
+    __slots__ = '_graph', '_begin', '_end', '_parents'
+
+    def __init__(self, graph: mygraph.CSRGraph, begin: array.array,
+                 end: array.array, parents: array.array) -> None:
+        self._graph = graph
+        self._begin = begin
+        self._end = end
+        self._parents = parents
+
+    def get_begin(self, vertex: mygraph.Vertex) -> int:
+        return self._begin[_require_index(self._graph, vertex)]
+
+    def get_end(self, vertex: mygraph.Vertex) -> int:
+        return self._end[_require_index(self._graph, vertex)]
+
+    def get_ascendant(self, vertex: mygraph.Vertex
+                      ) -> typing.Optional[mygraph.Vertex]:
+        parent = self._parents[_require_index(self._graph, vertex)]
+
+        return None if parent < 0 else self._graph.get_vertex_at(parent)
+
+    def get_begins(self) -> array.array:
+        return self._begin
+
+    def get_ends(self) -> array.array:
+        return self._end
+
+    def get_parents(self) -> array.array:
+        return self._parents
+
+
+class StronglyConnectedComponents(typing.Sized):
+    __slots__ = '_graph', '_components', '_count', '_condensation'
+
+    def __init__(self, graph: mygraph.CSRGraph, components: array.array,
+                 count: int) -> None:
+        self._graph = graph
+        self._components = components
+        self._count = count
+        self._condensation = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get_component(self, vertex: mygraph.Vertex) -> int:
+        return self._components[_require_index(self._graph, vertex)]
+
+    def get_components(self) -> array.array:
+        return self._components
+
+    def get_members(self) -> typing.List[typing.List[mygraph.Vertex]]:
+        members = [[] for _ in range(self._count)]
+        for index, component in enumerate(self._components):
+            members[component].append(self._graph.get_vertex_at(index))
+
+        return members
+
+    def get_condensation(self) -> mygraph.CSRGraph:
+        if self._condensation is None:
+            components = self._components
+            offsets = self._graph.get_offsets()
+            targets = self._graph.get_targets()
+            edges = set()
+            for vertex in range(len(self._graph)):
+                component = components[vertex]
+                for target in targets[offsets[vertex]:offsets[vertex + 1]]:
+                    if components[target] != component:
+                        edges.add((component, components[target]))
+
+            self._condensation = mygraph.CSRGraph.from_edges(
+                sorted(edges), keys=range(self._count))
+
+        return self._condensation
+
+
+class PageRankResult(typing.Sized):
+    __slots__ = '_graph', '_ranks', '_iterations', '_converged'
+
+    def __init__(self, graph: mygraph.CSRGraph, ranks: numpy.ndarray,
+                 iterations: int, converged: bool) -> None:
+        self._graph = graph
+        self._ranks = ranks
+        self._iterations = iterations
+        self._converged = converged
+
+    def __len__(self) -> int:
+        return len(self._ranks)
+
+    def get_rank(self, vertex: mygraph.Vertex) -> float:
+        return float(self._ranks[_require_index(self._graph, vertex)])
+
+    def get_ranks(self) -> numpy.ndarray:
+        return self._ranks
+
+    def get_rank_map(self) -> typing.Dict[mygraph.VertexKey, float]:
+        return dict(
+            zip(self._graph.get_vertex_index().get_keys(),
+                self._ranks.tolist()))
+
+    def get_iterations(self) -> int:
+        return self._iterations
+
+    def is_converged(self) -> bool:
+        return self._converged
+
+
+class LandmarkIndex:
+    __slots__ = [
+        '_graph',
+        '_fingerprint',
+        '_landmarks',
+        '_forward',
+        '_backward',
+    ]
+
+    def __init__(self,
+                 graph: mygraph.CSRGraph,
+                 landmarks: array.array,
+                 forward: typing.List[array.array],
+                 backward: typing.List[array.array],
+                 fingerprint: typing.Optional[bytes] = None) -> None:
+        self._graph = graph
+        self._fingerprint = _graph_fingerprint(
+            graph) if fingerprint is None else fingerprint
+        self._landmarks = landmarks
+        self._forward = forward
+        self._backward = backward
+
+    @classmethod
+    def build(cls,
+              graph: mygraph.GraphInterface,
+              landmarks_count: int = 8,
+              heap_type: typing.Type[
+                  myheap.AbstractHeap] = myheap.IndexedMinHeap
+              ) -> LandmarkIndex:
+        graph = graph.get_csr()
+        reversed_graph = graph.get_reversed()
+        landmarks = array.array('q')
+        forward = []
+        backward = []
+        if not len(graph):
+            return cls(graph, landmarks, forward, backward)
+
+        closest = array.array('d', [math.inf]) * len(graph)
+        landmark = 0
+        while len(landmarks) < landmarks_count and closest[landmark] > 0:
+            vertex = graph.get_vertex_at(landmark)
+            landmarks.append(landmark)
+            forward.append(dijkstra(graph, vertex, heap_type).get_distances())
+            backward.append(
+                dijkstra(reversed_graph, vertex, heap_type).get_distances())
+
+            for index, distance in enumerate(forward[-1]):
+                if 0 <= distance < closest[index]:
+                    closest[index] = distance
+            landmark = max(range(len(graph)), key=closest.__getitem__)
+
+        return cls(graph, landmarks, forward, backward)
+
+    @classmethod
+    def load(cls, graph: mygraph.CSRGraph, path: str) -> LandmarkIndex:
+        with open(path, 'rb') as index_file:
+            magic, landmarks_count, vertices_count, fingerprint = \
+                _LANDMARKS_HEADER.unpack(
+                    index_file.read(_LANDMARKS_HEADER.size))
+            if magic != _LANDMARKS_MAGIC or vertices_count != len(graph) or \
+                    fingerprint != _graph_fingerprint(graph):
+                raise ValueError('%s is not a landmark index of this graph' %
+                                 path)
+
+            landmarks = array.array('q')
+            landmarks.fromfile(index_file, landmarks_count)
+            tables = []
+            for _ in range(2 * landmarks_count):
+                table = array.array('d')
+                table.fromfile(index_file, vertices_count)
+                tables.append(table)
+
+        return cls(graph, landmarks, tables[:landmarks_count],
+                   tables[landmarks_count:], fingerprint)
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as index_file:
+            index_file.write(
+                _LANDMARKS_HEADER.pack(_LANDMARKS_MAGIC, len(self._landmarks),
+                                       len(self._graph), self._fingerprint))
+            self._landmarks.tofile(index_file)
+            for table in self._forward + self._backward:
+                table.tofile(index_file)
+
+    def get_graph(self) -> mygraph.CSRGraph:
+        return self._graph
+
+    def get_fingerprint(self) -> bytes:
+        return self._fingerprint
+
+    def get_landmarks(self) -> typing.List[mygraph.Vertex]:
+        return [self._graph.get_vertex_at(index) for index in self._landmarks]
+
+    def get_lower_bound(self, vertex: mygraph.Vertex,
+                        target: mygraph.Vertex) -> float:
+        return self._estimate(_require_index(self._graph, vertex),
+                              _require_index(self._graph, target))
+
+    def _estimate(self, vertex: int, target: int) -> float:
+        bound = 0
+        for forward, backward in zip(self._forward, self._backward):
+            from_vertex, from_target = forward[vertex], forward[target]
+            if from_vertex >= 0 and from_target - from_vertex > bound:
+                bound = from_target - from_vertex
+            to_vertex, to_target = backward[vertex], backward[target]
+            if to_target >= 0 and to_vertex - to_target > bound:
+                bound = to_vertex - to_target
+
+        return bound
+
+
+class _IndexedPriorityQueue(typing.Sized):
+    __slots__ = '_heap', '_handles', '_vertices'
+
+    def __init__(self, heap: myheap.IndexedHeap) -> None:
+        self._heap = heap
+        self._handles = dict()
+        self._vertices = dict()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, vertex: int, priority: float) -> None:
+        handle = self._heap.insert(priority)
+        self._handles[vertex] = handle
+        self._vertices[handle] = vertex
+
+    def promote(self, vertex: int, priority: float) -> None:
+        self._heap.promote_key(self._handles[vertex], priority)
+
+    def pop(self) -> typing.Tuple[int, float]:
+        handle = self._heap.get_highest_handle()
+        priority = self._heap.extract_highest()
+
+        return self._vertices.pop(handle), priority
+
+
+class _NodePriorityQueue(typing.Sized):
+    __slots__ = '_heap', '_node_type', '_nodes', '_vertices'
+
+    def __init__(self, heap: myheap.AbstractHeap,
+                 node_type: typing.Type) -> None:
+        self._heap = heap
+        self._node_type = node_type
+        self._nodes = dict()
+        self._vertices = dict()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, vertex: int, priority: float) -> None:
+        node = self._node_type(priority)
+        self._heap.insert(node)
+        self._nodes[vertex] = node
+        self._vertices[node] = vertex
+
+    def promote(self, vertex: int, priority: float) -> None:
+        self._heap.promote_key(self._nodes[vertex], priority)
+
+    def pop(self) -> typing.Tuple[int, float]:
+        node = self._heap.extract_highest_node()
+
+        return self._vertices.pop(node), self._heap.get_value(node)
+
+
 class VertexVisitor:
     def start_visiting(self, vertex: DFSVertex) -> None:
         vertex.color = Color.GREY
@@ -219,3 +1340,14 @@ class VertexStack(typing.Iterable):
 
     def is_empty(self) -> bool:
         return self._size == 0
+
+
+class CycleException(RuntimeError):
+
+    def __init__(self, cycle: typing.List[mygraph.Vertex]) -> None:
+        super().__init__('Graph has a cycle: %s' %
+                         ' -> '.join(str(vertex.get_key()) for vertex in cycle))
+        self._cycle = cycle
+
+    def get_cycle(self) -> typing.List[mygraph.Vertex]:
+        return self._cycle
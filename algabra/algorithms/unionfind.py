@@ -1,3 +1,16 @@
+import array
+import collections
+import multiprocessing
+import os
+import typing
+
+import numpy
+
+ElementPair = typing.Tuple[int, int]
+
+_shared_tiles = dict()
+
+
 class Component:
     __slots__ = 'parent', 'size', 'key'
 
@@ -39,7 +52,7 @@ class ComponentMatrix:
     def require(self, i: int, j: int):
         if not self.is_open(i, j):
             raise IndexError('Component %d:%d is closed or not in the matrix' % (i, j))
-        key = '%d%d' % (i, j)
+        key = (i, j)
         if key not in self._open_components:
             self._open_components[key] = Component()
         return self._open_components[key]
@@ -55,22 +68,412 @@ class ComponentMatrix:
         return False
 
 
+class DisjointSet(typing.Sized):
+    __slots__ = '_parents', '_sizes', '_count', '_max_size'
+
+    def __init__(self, size: int) -> None:
+        typecode = 'i' if size <= 0x7fffffff else 'q'
+        self._parents = array.array(typecode, range(size))
+        self._sizes = array.array(typecode, [1]) * size
+        self._count = size
+        self._max_size = 1 if size else 0
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def find(self, element: int) -> int:
+        parents = self._parents
+        while parents[element] != element:
+            parents[element] = parents[parents[element]]
+            element = parents[element]
+
+        return element
+
+    def find_many(self, elements: typing.Iterable[int]) -> array.array:
+        find = self.find
+        return array.array(self._parents.typecode, map(find, elements))
+
+    def union(self, first: int, second: int) -> bool:
+        first = self.find(first)
+        second = self.find(second)
+        if first == second:
+            return False
+
+        sizes = self._sizes
+        if sizes[first] < sizes[second]:
+            first, second = second, first
+
+        self._parents[second] = first
+        sizes[first] += sizes[second]
+        self._count -= 1
+        if sizes[first] > self._max_size:
+            self._max_size = sizes[first]
+
+        return True
+
+    def union_many(self, pairs: typing.Iterable[ElementPair]) -> int:
+        union = self.union
+        return sum(union(first, second) for first, second in pairs)
+
+    def connected(self, first: int, second: int) -> bool:
+        return self.find(first) == self.find(second)
+
+    def get_size(self, element: int) -> int:
+        return self._sizes[self.find(element)]
+
+    def get_count(self) -> int:
+        return self._count
+
+    def get_max_size(self) -> int:
+        return self._max_size
+
+
+class IncrementalConnectivity(DisjointSet):
+    __slots__ = '_merged', '_previous_max_sizes', '_histogram'
+
+    def __init__(self, size: int) -> None:
+        super().__init__(size)
+        self._merged = array.array(self._parents.typecode)
+        self._previous_max_sizes = array.array('q')
+        self._histogram = collections.Counter({1: size} if size else {})
+
+    def find(self, element: int) -> int:
+        parents = self._parents
+        while parents[element] != element:
+            element = parents[element]
+
+        return element
+
+    def union(self, first: int, second: int) -> bool:
+        first = self.find(first)
+        second = self.find(second)
+        if first == second:
+            return False
+
+        sizes = self._sizes
+        if sizes[first] < sizes[second]:
+            first, second = second, first
+
+        histogram = self._histogram
+        self._discount(sizes[first])
+        self._discount(sizes[second])
+        self._parents[second] = first
+        sizes[first] += sizes[second]
+        histogram[sizes[first]] += 1
+        self._count -= 1
+        self._merged.append(second)
+        self._previous_max_sizes.append(self._max_size)
+        if sizes[first] > self._max_size:
+            self._max_size = sizes[first]
+
+        return True
+
+    def connected_many(self, pairs: typing.Iterable[ElementPair]
+                       ) -> typing.List[bool]:
+        find = self.find
+        return [find(first) == find(second) for first, second in pairs]
+
+    def get_sizes(self, elements: typing.Iterable[int]) -> array.array:
+        sizes = self._sizes
+        find = self.find
+        return array.array('q', (sizes[find(element)] for element in elements))
+
+    def get_histogram(self) -> typing.Dict[int, int]:
+        return dict(self._histogram)
+
+    def snapshot(self) -> int:
+        return len(self._merged)
+
+    def rollback(self, snapshot: int) -> None:
+        if not 0 <= snapshot <= len(self._merged):
+            raise IndexError('Snapshot %d is not in the undo log of length %d'
+                             % (snapshot, len(self._merged)))
+
+        parents = self._parents
+        sizes = self._sizes
+        histogram = self._histogram
+        while len(self._merged) > snapshot:
+            child = self._merged.pop()
+            root = parents[child]
+            self._discount(sizes[root])
+            sizes[root] -= sizes[child]
+            parents[child] = child
+            histogram[sizes[root]] += 1
+            histogram[sizes[child]] += 1
+            self._count += 1
+            self._max_size = self._previous_max_sizes.pop()
+
+    def _discount(self, size: int) -> None:
+        self._histogram[size] -= 1
+        if not self._histogram[size]:
+            del self._histogram[size]
+
+
+class GridLabels(typing.Sized):
+    __slots__ = '_labels', '_sizes'
+
+    def __init__(self, labels: numpy.ndarray, sizes: numpy.ndarray) -> None:
+        self._labels = labels
+        self._sizes = sizes
+
+    def __len__(self) -> int:
+        return len(self._sizes) - 1
+
+    def get_labels(self) -> numpy.ndarray:
+        return self._labels
+
+    def get_sizes(self) -> numpy.ndarray:
+        return self._sizes
+
+    def get_size(self, label: int) -> int:
+        return int(self._sizes[label])
+
+    def get_largest(self) -> int:
+        if len(self) == 0:
+            return 0
+
+        return int(numpy.argmax(self._sizes[1:])) + 1
+
+    def get_max_size(self) -> int:
+        return self.get_size(self.get_largest()) if len(self) else 0
+
+
+def label_grid(grid, connectivity: int = 8) -> GridLabels:
+    if connectivity not in (4, 8):
+        raise ValueError('Connectivity must be 4 or 8, got %r' % connectivity)
+
+    grid = numpy.asarray(grid)
+    if grid.ndim != 2:
+        raise ValueError('Grid must be two-dimensional, got %d dimensions' %
+                         grid.ndim)
+
+    rows, cols = grid.shape
+    width = cols + 2
+    padded = numpy.zeros((rows, width), dtype=numpy.int8)
+    padded[:, 1:-1] = grid != 0
+    steps = numpy.diff(padded, axis=1)
+    run_rows, run_starts = numpy.nonzero(steps == 1)
+    run_ends = numpy.nonzero(steps == -1)[1]
+    runs = len(run_starts)
+
+    reach = 1 if connectivity == 8 else 0
+    previous = (run_rows - 1) * width
+    lower = numpy.searchsorted(run_rows * width + run_ends,
+                               previous + run_starts - reach,
+                               side='right')
+    upper = numpy.searchsorted(run_rows * width + run_starts,
+                               previous + run_ends + reach,
+                               side='left')
+    counts = numpy.maximum(upper - lower, 0)
+    below = numpy.repeat(numpy.arange(runs), counts)
+    above = numpy.repeat(lower - numpy.cumsum(counts) + counts, counts)
+    above += numpy.arange(len(above))
+
+    roots = _merge_runs(runs, above, below)
+    run_labels = numpy.cumsum(roots == numpy.arange(runs))[roots]
+
+    lengths = run_ends - run_starts
+    dtype = numpy.int32 if runs < 0x7fffffff else numpy.int64
+    labels = numpy.zeros(rows * cols, dtype=dtype)
+    cells = numpy.repeat(run_rows * cols + run_starts - numpy.cumsum(lengths) +
+                         lengths, lengths)
+    labels[cells + numpy.arange(len(cells))] = numpy.repeat(
+        run_labels, lengths)
+    sizes = numpy.bincount(run_labels, weights=lengths,
+                           minlength=1).astype(numpy.int64)
+    sizes[0] = rows * cols - len(cells)
+
+    return GridLabels(labels.reshape(rows, cols), sizes)
+
+
+def label_tiled_grid(grid: numpy.ndarray,
+                     labels: typing.Union[str, os.PathLike, numpy.ndarray],
+                     tile_size: int = 4096,
+                     connectivity: int = 8,
+                     workers: typing.Optional[int] = None) -> GridLabels:
+    if connectivity not in (4, 8):
+        raise ValueError('Connectivity must be 4 or 8, got %r' % connectivity)
+    if grid.ndim != 2:
+        raise ValueError('Grid must be two-dimensional, got %d dimensions' %
+                         grid.ndim)
+    if isinstance(labels, (str, os.PathLike)):
+        labels = numpy.memmap(labels,
+                              dtype=numpy.int64,
+                              mode='w+',
+                              shape=grid.shape)
+
+    rows, cols = grid.shape
+    tiles = [(top, min(top + tile_size, rows), left,
+              min(left + tile_size, cols))
+             for top in range(0, rows, tile_size)
+             for left in range(0, cols, tile_size)]
+    tile_rows = -(-rows // tile_size)
+    tile_cols = -(-cols // tile_size)
+
+    workers = multiprocessing.cpu_count() if workers is None else workers
+    parallel = workers > 1 and all(
+        isinstance(array, numpy.memmap) and array.filename
+        for array in (grid, labels))
+    if parallel:
+        pool = multiprocessing.Pool(workers, _attach_memmaps,
+                                    (_describe_memmap(grid),
+                                     _describe_memmap(labels)))
+        mapper = pool.map
+    else:
+        pool = None
+        _shared_tiles.update(grid=grid, labels=labels)
+        mapper = map
+
+    try:
+        tasks = [tile + (connectivity,) for tile in tiles]
+        tile_sizes = list(mapper(_label_tile, tasks))
+        counts = numpy.array([len(sizes) for sizes in tile_sizes],
+                             dtype=numpy.int64)
+        offsets = (numpy.cumsum(counts) - counts).reshape(tile_rows, tile_cols)
+        sizes = numpy.concatenate([numpy.zeros(1, dtype=numpy.int64)] +
+                                  tile_sizes)
+
+        first, second = [], []
+        for top in range(tile_size, rows, tile_size):
+            _pair_lines(_read_global_row(labels, top - 1, offsets, tile_size),
+                        _read_global_row(labels, top, offsets, tile_size),
+                        connectivity, first, second)
+        for left in range(tile_size, cols, tile_size):
+            _pair_lines(
+                _read_global_column(labels, left - 1, offsets, tile_size),
+                _read_global_column(labels, left, offsets, tile_size),
+                connectivity, first, second)
+
+        keys, inverse = numpy.unique(numpy.concatenate(
+            first + second + [numpy.zeros(0, dtype=numpy.int64)]),
+                                     return_inverse=True)
+        inverse = inverse.reshape(2, -1)
+        roots = keys[_merge_runs(len(keys), inverse[0], inverse[1])]
+        merged = keys != roots
+        numpy.add.at(sizes, roots[merged], sizes[keys[merged]])
+        removed = keys[merged]
+        sizes = numpy.delete(sizes, removed)
+        sizes[0] = rows * cols - sizes[1:].sum()
+
+        tasks = [
+            tile + (offset, keys, roots, removed)
+            for tile, offset in zip(tiles, offsets.ravel())
+        ]
+        for _ in mapper(_relabel_tile, tasks):
+            pass
+    finally:
+        if pool is None:
+            _shared_tiles.clear()
+        else:
+            pool.close()
+            pool.join()
+
+    if isinstance(labels, numpy.memmap):
+        labels.flush()
+
+    return GridLabels(labels, sizes)
+
+
+def _describe_memmap(
+        array: numpy.memmap) -> typing.Tuple[str, str, tuple, int, str]:
+    order = 'F' if array.flags.f_contiguous and array.ndim > 1 and \
+        not array.flags.c_contiguous else 'C'
+
+    return array.filename, array.dtype.str, array.shape, array.offset, order
+
+
+def _attach_memmaps(grid: typing.Tuple[str, str, tuple, int, str],
+                    labels: typing.Tuple[str, str, tuple, int, str]) -> None:
+    arrays = dict()
+    for name, (filename, dtype, shape, offset, order) in (('grid', grid),
+                                                          ('labels',
+                                                           labels)):
+        arrays[name] = numpy.memmap(filename,
+                                    dtype=dtype,
+                                    mode='r' if name == 'grid' else 'r+',
+                                    shape=shape,
+                                    offset=offset,
+                                    order=order)
+
+    _shared_tiles.update(arrays)
+
+
+def _label_tile(task: tuple) -> numpy.ndarray:
+    top, bottom, left, right, connectivity = task
+    tile = label_grid(_shared_tiles['grid'][top:bottom, left:right],
+                      connectivity)
+    _shared_tiles['labels'][top:bottom, left:right] = tile.get_labels()
+
+    return tile.get_sizes()[1:]
+
+
+def _relabel_tile(task: tuple) -> None:
+    top, bottom, left, right, offset, keys, roots, removed = task
+    labels = _shared_tiles['labels']
+    tile = numpy.array(labels[top:bottom, left:right], dtype=numpy.int64)
+    occupied = tile != 0
+    tile[occupied] += offset
+
+    positions = numpy.minimum(numpy.searchsorted(keys, tile),
+                              max(len(keys) - 1, 0))
+    if len(keys):
+        matched = occupied & (keys[positions] == tile)
+        tile[matched] = roots[positions[matched]]
+    tile[occupied] -= numpy.searchsorted(removed, tile[occupied])
+
+    labels[top:bottom, left:right] = tile
+
+
+def _read_global_row(labels: numpy.ndarray, row: int, offsets: numpy.ndarray,
+                     tile_size: int) -> numpy.ndarray:
+    line = numpy.array(labels[row, :], dtype=numpy.int64)
+    shifts = numpy.repeat(offsets[row // tile_size], tile_size)[:len(line)]
+
+    return numpy.where(line != 0, line + shifts, 0)
+
+
+def _read_global_column(labels: numpy.ndarray, column: int,
+                        offsets: numpy.ndarray,
+                        tile_size: int) -> numpy.ndarray:
+    line = numpy.array(labels[:, column], dtype=numpy.int64)
+    shifts = numpy.repeat(offsets[:, column // tile_size],
+                          tile_size)[:len(line)]
+
+    return numpy.where(line != 0, line + shifts, 0)
+
+
+def _pair_lines(before: numpy.ndarray, after: numpy.ndarray,
+                connectivity: int, first: typing.List[numpy.ndarray],
+                second: typing.List[numpy.ndarray]) -> None:
+    candidates = [(before, after)]
+    if connectivity == 8:
+        candidates += [(before[:-1], after[1:]), (before[1:], after[:-1])]
+
+    for one, other in candidates:
+        touching = (one != 0) & (other != 0)
+        first.append(one[touching])
+        second.append(other[touching])
+
+
+def _merge_runs(runs: int, first: numpy.ndarray,
+                second: numpy.ndarray) -> numpy.ndarray:
+    parents = numpy.arange(runs)
+    while len(first):
+        first_roots = parents[first]
+        second_roots = parents[second]
+        merging = first_roots != second_roots
+        first, second = first[merging], second[merging]
+        first_roots, second_roots = first_roots[merging], second_roots[merging]
+        numpy.minimum.at(parents, numpy.maximum(first_roots, second_roots),
+                         numpy.minimum(first_roots, second_roots))
+
+        compressed = parents[parents]
+        while not numpy.array_equal(compressed, parents):
+            parents = compressed
+            compressed = parents[parents]
+
+    return parents
+
+
 def connected_cell(matrix):
-    components = ComponentMatrix(matrix)
-    max_size = 0
-    for i in range(0, len(matrix)):
-        for j in range(len(matrix[i])):
-            if not components.is_open(i, j):
-                continue
-            component = components.require(i, j)
-            adjacent_components = [
-                (i, j - 1), (i - 1, j - 1), (i - 1, j), (i - 1, j + 1),
-                (i, j + 1), (i + 1, j + 1), (i + 1, j), (i + 1, j - 1)
-            ]
-            for adjacent in adjacent_components:
-                if components.is_open(*adjacent):
-                    component.connect(components.require(*adjacent))
-            size = component.get_root().size
-            max_size = size if size > max_size else max_size
-
-    return max_size
+    return label_grid(numpy.asarray(matrix) == 1).get_max_size()
@@ -1,8 +1,37 @@
 from __future__ import annotations
 
 import abc
+import array
+import bisect
+import mmap
+import re
+import struct
 import typing
 
+EDGES_CHUNK_SIZE = 1 << 20
+
+VertexKey = typing.Hashable
+EdgeTuple = typing.Union[typing.Tuple[VertexKey, VertexKey],
+                        typing.Tuple[VertexKey, VertexKey, float]]
+WeightedVertex = typing.Tuple['Vertex', float]
+VertexFactory = typing.Callable[[VertexKey], 'Vertex']
+
+_GRAPH_MAGIC = b'ACSR'
+_GRAPH_VERSION = 2
+_GRAPH_HEADER = struct.Struct('<4sHHqq')
+_WEIGHTED_FLAG = 1
+_DENSE_KEYS_FLAG = 2
+_WIDE_TARGETS_FLAG = 4
+_STRING_KEYS_FLAG = 8
+
+_NONZERO_BYTES = re.compile(b'[^\\x00]')
+_BYTE_BITS = [
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+]
+_BIT_TABLES = [
+    bytes(byte >> bit & 1 for byte in range(256)) for bit in range(8)
+]
+
 
 class GraphInterface(abc.ABC):
 
@@ -11,44 +40,104 @@ class GraphInterface(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def get_vertex(self, key: int) -> typing.Optional[Vertex]:
+    def get_vertex(self, key: VertexKey) -> typing.Optional[Vertex]:
         pass
 
     @abc.abstractmethod
-    def add_edge(self, vertex_from: Vertex, vertex_to: Vertex) -> None:
+    def add_edge(self,
+                 vertex_from: Vertex,
+                 vertex_to: Vertex,
+                 weight: float = 1) -> None:
         pass
 
     @abc.abstractmethod
     def vertex_has_edge_with(self, vertex: Vertex, target: Vertex) -> bool:
         pass
 
+    @abc.abstractmethod
+    def get_adjacent(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        pass
+
+    @abc.abstractmethod
+    def get_predecessors(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        pass
+
+    @abc.abstractmethod
+    def get_weighted_adjacent(
+            self, vertex: Vertex) -> typing.Iterator[WeightedVertex]:
+        pass
+
+    def get_vertex_index(self) -> typing.Optional[VertexIndex]:
+        return None
+
+    def get_csr(self) -> CSRGraph:
+        return CSRGraph.from_graph(self)
+
+    def save(self, path: str) -> None:
+        self.get_csr().save(path)
+
 
 class AdjacencyListGraph(GraphInterface, typing.Iterable):
-    __slots__ = ['_vertices']
+    __slots__ = ['_index', '_vertices', '_predecessors', '_csr']
 
     def __init__(self) -> None:
-        self._vertices = dict()
+        self._index = VertexIndex()
+        self._vertices = []
+        self._predecessors = None
+        self._csr = None
 
     def __iter__(self) -> typing.Iterator[Vertex]:
-        for key in self._vertices:
-            yield self._vertices[key].get_vertex()
+        return iter(self._index)
+
+    @classmethod
+    def from_edges(cls,
+                   edges: typing.Iterable[EdgeTuple],
+                   vertex_factory: typing.Optional[VertexFactory] = None
+                   ) -> AdjacencyListGraph:
+        vertex_factory = Vertex if vertex_factory is None else vertex_factory
+        result = cls()
+        index, vertices = result._index, result._vertices
+
+        for edge in edges:
+            key_from, key_to = edge[0], edge[1]
+            id_from = index.get_id(key_from)
+            if id_from is None:
+                id_from = result._append(vertex_factory(key_from))
+            id_to = index.get_id(key_to)
+            if id_to is None:
+                id_to = result._append(vertex_factory(key_to))
+
+            vertices[id_from].add_adjacent(vertices[id_to].get_vertex(),
+                                           edge[2] if len(edge) > 2 else 1)
 
-    def add_vertex(self, vertex: Vertex) -> None:
-        key = vertex.get_key()
-        if key not in self._vertices:
-            self._vertices[key] = AdjacentVerticesList(vertex)
+        return result
 
-    def get_vertex(self, key: int) -> typing.Optional[Vertex]:
-        if key in self._vertices:
-            return self._vertices[key].get_vertex()
-        else:
-            return None
+    @classmethod
+    def from_file(cls,
+                  path: str,
+                  vertex_factory: typing.Optional[VertexFactory] = None,
+                  chunk_size: int = EDGES_CHUNK_SIZE) -> AdjacencyListGraph:
+        return cls.from_edges(read_edges(path, chunk_size), vertex_factory)
 
-    def add_edge(self, vertex_from: Vertex, vertex_to: Vertex) -> None:
+    def add_vertex(self, vertex: Vertex) -> None:
+        if vertex.get_key() not in self._index:
+            self._append(vertex)
+            self._predecessors = None
+            self._csr = None
+
+    def get_vertex(self, key: VertexKey) -> typing.Optional[Vertex]:
+        return self._index.find_vertex(key)
+
+    def add_edge(self,
+                 vertex_from: Vertex,
+                 vertex_to: Vertex,
+                 weight: float = 1) -> None:
         vertex_froms_edges = self._require_edges(vertex_from)
         self._require_edges(vertex_to)
 
-        vertex_froms_edges.add_adjacent(vertex_to)
+        vertex_froms_edges.add_adjacent(vertex_to, weight)
+        self._predecessors = None
+        self._csr = None
 
     def vertex_has_edge_with(self, vertex: Vertex, target: Vertex) -> bool:
         vertex_edges = self.get_edges(vertex)
@@ -58,13 +147,58 @@ class AdjacencyListGraph(GraphInterface, typing.Iterable):
 
         return False
 
+    def get_adjacent(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        vertex_edges = self.get_edges(vertex)
+
+        if vertex_edges is not None:
+            for edge in vertex_edges:
+                yield edge.get_vertex()
+
+    def get_weighted_adjacent(
+            self, vertex: Vertex) -> typing.Iterator[WeightedVertex]:
+        vertex_edges = self.get_edges(vertex)
+
+        if vertex_edges is not None:
+            for edge in vertex_edges:
+                yield edge.get_vertex(), edge.get_weight()
+
+    def get_predecessors(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        index = self._index
+        if self._predecessors is None:
+            predecessors = [[] for _ in self._vertices]
+            for vertex_edges in self._vertices:
+                for edge in vertex_edges:
+                    predecessors[index.get_id(
+                        edge.get_vertex().get_key())].append(
+                            vertex_edges.get_vertex())
+            self._predecessors = predecessors
+
+        vertex_id = index.get_id(vertex.get_key())
+
+        return iter(() if vertex_id is None else self._predecessors[vertex_id])
+
     def get_edges(self,
                   vertex: Vertex) -> typing.Optional[AdjacentVerticesList]:
-        if vertex.get_key() in self._vertices:
-            return self._vertices[vertex.get_key()]
+        vertex_id = self._index.get_id(vertex.get_key())
+        if vertex_id is not None:
+            return self._vertices[vertex_id]
         else:
             return None
 
+    def get_vertex_index(self) -> VertexIndex:
+        return self._index
+
+    def get_csr(self) -> CSRGraph:
+        if self._csr is None:
+            self._csr = CSRGraph.from_graph(self)
+
+        return self._csr
+
+    def _append(self, vertex: Vertex) -> int:
+        self._vertices.append(AdjacentVerticesList(vertex))
+
+        return self._index.add(vertex)
+
     def _require_edges(self, vertex: Vertex) -> AdjacentVerticesList:
         result = self.get_edges(vertex)
         if result is not None and result.get_vertex() != vertex:
@@ -76,37 +210,125 @@ class AdjacencyListGraph(GraphInterface, typing.Iterable):
         return result
 
 
-class AdjacencyMatrixGraph(GraphInterface):
-    __slots__ = ['_vertices', '_edges']
+class AdjacencyMatrixGraph(GraphInterface, typing.Iterable, typing.Sized):
+    __slots__ = ['_index', '_matrix', '_capacity', '_weights', '_csr']
 
     def __init__(self) -> None:
-        self._vertices = dict()
-        self._edges = dict()
+        self._index = VertexIndex()
+        self._matrix = bytearray()
+        self._capacity = 0
+        self._weights = None
+        self._csr = None
+
+    def __iter__(self) -> typing.Iterator[Vertex]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
 
     def add_vertex(self, vertex: Vertex) -> None:
-        self._edges[vertex.get_key()] = dict()
-        for key in self._vertices.keys():
-            self._edges[key][vertex.get_key()] = False
-            self._edges[vertex.get_key()][key] = False
+        if vertex.get_key() not in self._index:
+            if len(self._index) == self._capacity:
+                self._grow()
 
-        self._vertices[vertex.get_key()] = vertex
+            self._index.add(vertex)
+            self._csr = None
 
-    def get_vertex(self, key: int) -> typing.Optional[Vertex]:
-        return self._vertices[key] if key in self._vertices else None
+    def get_vertex(self, key: VertexKey) -> typing.Optional[Vertex]:
+        return self._index.find_vertex(key)
 
-    def add_edge(self, vertex_from: Vertex, vertex_to: Vertex) -> None:
+    def add_edge(self,
+                 vertex_from: Vertex,
+                 vertex_to: Vertex,
+                 weight: float = 1) -> None:
         self._require_vertex(vertex_to)
         self._require_vertex(vertex_from)
 
-        self._edges[vertex_from.get_key()][vertex_to.get_key()] = True
+        row = self._index.get_id(vertex_from.get_key())
+        column = self._index.get_id(vertex_to.get_key())
+        cell = row * (self._capacity >> 3) + (column >> 3)
+        if not self._matrix[cell] >> (column & 7) & 1:
+            self._matrix[cell] |= 1 << (column & 7)
+            if weight != 1:
+                if self._weights is None:
+                    self._weights = array.array('d', [1]) * (self._capacity *
+                                                             self._capacity)
+                self._weights[row * self._capacity + column] = weight
+            self._csr = None
 
     def vertex_has_edge_with(self, vertex: Vertex, target: Vertex) -> bool:
-        vertex_key = vertex.get_key()
-        target_key = target.get_key()
-        if vertex_key in self._edges and target_key in self._edges[vertex_key]:
-            return self._edges[vertex_key][target_key]
-
-        return False
+        row = self._index.get_id(vertex.get_key())
+        column = self._index.get_id(target.get_key())
+        if row is None or column is None:
+            return False
+
+        cell = self._matrix[row * (self._capacity >> 3) + (column >> 3)]
+
+        return bool(cell >> (column & 7) & 1)
+
+    def get_adjacent(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        row = self._index.get_id(vertex.get_key())
+        if row is not None:
+            vertices = self._index.get_vertices()
+            for column in self._get_columns(row):
+                yield vertices[column]
+
+    def get_weighted_adjacent(
+            self, vertex: Vertex) -> typing.Iterator[WeightedVertex]:
+        row = self._index.get_id(vertex.get_key())
+        if row is not None:
+            vertices, weights = self._index.get_vertices(), self._weights
+            first = row * self._capacity
+            for column in self._get_columns(row):
+                weight = 1 if weights is None else weights[first + column]
+                yield vertices[column], weight
+
+    def get_predecessors(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        column = self._index.get_id(vertex.get_key())
+        if column is not None:
+            vertices = self._index.get_vertices()
+            stride = self._capacity >> 3
+            cells = self._matrix[column >> 3:len(vertices) * stride:stride]
+            hits = cells.translate(_BIT_TABLES[column & 7])
+            for match in _NONZERO_BYTES.finditer(hits):
+                yield vertices[match.start()]
+
+    def get_vertex_index(self) -> VertexIndex:
+        return self._index
+
+    def get_csr(self) -> CSRGraph:
+        if self._csr is None:
+            self._csr = CSRGraph.from_graph(self)
+
+        return self._csr
+
+    def _grow(self) -> None:
+        stride = self._capacity >> 3
+        capacity = max(8, self._capacity * 2)
+        new_stride = capacity >> 3
+        matrix = bytearray(capacity * new_stride)
+        for row in range(len(self._index)):
+            matrix[row * new_stride:row * new_stride + stride] = \
+                self._matrix[row * stride:(row + 1) * stride]
+
+        if self._weights is not None:
+            previous = self._capacity
+            weights = array.array('d', [1]) * (capacity * capacity)
+            for row in range(len(self._index)):
+                weights[row * capacity:row * capacity + previous] = \
+                    self._weights[row * previous:(row + 1) * previous]
+            self._weights = weights
+
+        self._matrix = matrix
+        self._capacity = capacity
+
+    def _get_columns(self, row: int) -> typing.Iterator[int]:
+        stride = self._capacity >> 3
+        cells = self._matrix[row * stride:(row + 1) * stride]
+        for match in _NONZERO_BYTES.finditer(cells):
+            column = match.start()
+            for bit in _BYTE_BITS[cells[column]]:
+                yield (column << 3) + bit
 
     def _require_vertex(self, vertex: Vertex) -> Vertex:
         result = self.get_vertex(vertex.get_key())
@@ -120,22 +342,578 @@ class AdjacencyMatrixGraph(GraphInterface):
         return result
 
 
+class CSRGraph(GraphInterface, typing.Iterable, typing.Sized):
+    __slots__ = [
+        '_index',
+        '_offsets',
+        '_targets',
+        '_weights',
+        '_reverse_offsets',
+        '_reverse_sources',
+    ]
+
+    def __init__(self) -> None:
+        self._index = VertexIndex()
+        self._offsets = array.array('q', [0])
+        self._targets = array.array(_get_index_typecode(0))
+        self._weights = None
+        self._reverse_offsets = None
+        self._reverse_sources = None
+
+    def __iter__(self) -> typing.Iterator[Vertex]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @classmethod
+    def from_graph(cls, graph: GraphInterface) -> CSRGraph:
+        result = cls()
+        source_index = graph.get_vertex_index()
+        sources = array.array('q')
+        targets = array.array('q')
+        weights = array.array('d')
+        if source_index is None:
+            index = result._index
+            for vertex in graph:
+                index.require(vertex)
+
+            for vertex in graph:
+                source = index.get_id(vertex.get_key())
+                for adjacent, weight in graph.get_weighted_adjacent(vertex):
+                    sources.append(source)
+                    targets.append(index.require(adjacent))
+                    weights.append(weight)
+        else:
+            result._index = source_index.copy()
+            get_id = source_index.get_id
+            for source, vertex in enumerate(source_index):
+                for adjacent, weight in graph.get_weighted_adjacent(vertex):
+                    sources.append(source)
+                    targets.append(get_id(adjacent.get_key()))
+                    weights.append(weight)
+
+        result._compress(sources, targets, weights)
+
+        return result
+
+    @classmethod
+    def from_edges(cls,
+                   edges: typing.Iterable[EdgeTuple],
+                   vertex_factory: typing.Optional[VertexFactory] = None,
+                   keys: typing.Iterable[VertexKey] = ()) -> CSRGraph:
+        vertex_factory = Vertex if vertex_factory is None else vertex_factory
+        result = cls()
+        index = result._index
+        for key in keys:
+            if key not in index:
+                index.add(vertex_factory(key))
+
+        sources = array.array('q')
+        targets = array.array('q')
+        weights = array.array('d')
+        for edge in edges:
+            key_from, key_to = edge[0], edge[1]
+            id_from = index.get_id(key_from)
+            if id_from is None:
+                id_from = index.add(vertex_factory(key_from))
+            id_to = index.get_id(key_to)
+            if id_to is None:
+                id_to = index.add(vertex_factory(key_to))
+            sources.append(id_from)
+            targets.append(id_to)
+            weights.append(edge[2] if len(edge) > 2 else 1)
+
+        result._compress(sources, targets, weights)
+
+        return result
+
+    @classmethod
+    def from_file(cls,
+                  path: str,
+                  vertex_factory: typing.Optional[VertexFactory] = None,
+                  chunk_size: int = EDGES_CHUNK_SIZE) -> CSRGraph:
+        return cls.from_edges(read_edges(path, chunk_size), vertex_factory)
+
+    @classmethod
+    def load(cls,
+             path: str,
+             vertex_factory: typing.Optional[VertexFactory] = None
+             ) -> CSRGraph:
+        with open(path, 'rb') as graph_file:
+            buffer = mmap.mmap(graph_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(buffer)
+        if len(view) < _GRAPH_HEADER.size:
+            raise ValueError('%s is not a graph file' % path)
+        magic, version, flags, vertices_count, edges_count = \
+            _GRAPH_HEADER.unpack_from(view)
+        if magic != _GRAPH_MAGIC or version != _GRAPH_VERSION:
+            raise ValueError('%s is not a graph file of version %d' %
+                             (path, _GRAPH_VERSION))
+
+        sections = [('q', vertices_count + 1),
+                    ('q' if flags & _WIDE_TARGETS_FLAG else 'i', edges_count)]
+        if flags & _WEIGHTED_FLAG:
+            sections.append(('d', edges_count))
+        if flags & _STRING_KEYS_FLAG:
+            sections += [('q', vertices_count + 1), ('q', vertices_count)]
+        elif not flags & _DENSE_KEYS_FLAG:
+            sections += [('q', vertices_count)] * 3
+
+        arrays = []
+        begin = _GRAPH_HEADER.size
+        for typecode, length in sections:
+            end = begin + length * struct.calcsize(typecode)
+            if end > len(view):
+                raise ValueError('%s is truncated' % path)
+            arrays.append(view[begin:end].cast(typecode))
+            begin = _align(end)
+
+        result = cls()
+        result._offsets, result._targets = arrays[0], arrays[1]
+        if flags & _WEIGHTED_FLAG:
+            result._weights = arrays[2]
+        if flags & _DENSE_KEYS_FLAG:
+            result._index = VertexIndex.from_keys(range(vertices_count),
+                                                  vertex_factory)
+        elif flags & _STRING_KEYS_FLAG:
+            key_offsets, order = arrays[-2:]
+            end = begin + key_offsets[-1]
+            if end > len(view):
+                raise ValueError('%s is truncated' % path)
+            keys = _MappedStrings(key_offsets, view[begin:end])
+            result._index = VertexIndex.from_keys(
+                keys, vertex_factory,
+                _SortedIds(_PermutedKeys(keys, order), order))
+        else:
+            keys, sorted_keys, order = arrays[-3:]
+            result._index = VertexIndex.from_keys(
+                keys, vertex_factory, _SortedIds(sorted_keys, order))
+
+        return result
+
+    def save(self, path: str) -> None:
+        keys = list(self._index.get_keys())
+        sections = [self._offsets, self._targets]
+        flags = 0
+        if self._weights is not None:
+            flags |= _WEIGHTED_FLAG
+            sections.append(self._weights)
+        if memoryview(self._targets).itemsize == 8:
+            flags |= _WIDE_TARGETS_FLAG
+
+        if all(type(key) is int for key in keys):
+            if keys == list(range(len(keys))):
+                flags |= _DENSE_KEYS_FLAG
+            else:
+                order = sorted(range(len(keys)), key=keys.__getitem__)
+                sections += [
+                    array.array('q', keys),
+                    array.array('q', (keys[vertex_id] for vertex_id in order)),
+                    array.array('q', order),
+                ]
+        elif all(isinstance(key, str) for key in keys):
+            flags |= _STRING_KEYS_FLAG
+            encoded = [key.encode('utf-8') for key in keys]
+            key_offsets = array.array('q', [0])
+            for key in encoded:
+                key_offsets.append(key_offsets[-1] + len(key))
+            order = sorted(range(len(keys)), key=encoded.__getitem__)
+            sections += [
+                key_offsets,
+                array.array('q', order),
+                b''.join(encoded),
+            ]
+        else:
+            raise TypeError('Only int or str vertex keys can be saved')
+
+        with open(path, 'wb') as graph_file:
+            graph_file.write(
+                _GRAPH_HEADER.pack(_GRAPH_MAGIC, _GRAPH_VERSION, flags,
+                                   len(self), len(self._targets)))
+            for section in sections:
+                size = graph_file.write(memoryview(section).cast('B'))
+                graph_file.write(bytes(_align(size) - size))
+
+    def add_vertex(self, vertex: Vertex) -> None:
+        raise ImmutableGraphException(self)
+
+    def get_vertex(self, key: VertexKey) -> typing.Optional[Vertex]:
+        return self._index.find_vertex(key)
+
+    def add_edge(self,
+                 vertex_from: Vertex,
+                 vertex_to: Vertex,
+                 weight: float = 1) -> None:
+        raise ImmutableGraphException(self)
+
+    def vertex_has_edge_with(self, vertex: Vertex, target: Vertex) -> bool:
+        index = self.get_index(vertex)
+        target_index = self.get_index(target)
+        if index is None or target_index is None:
+            return False
+
+        begin, end = self._offsets[index], self._offsets[index + 1]
+
+        return target_index in self._targets[begin:end]
+
+    def get_adjacent(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        index = self.get_index(vertex)
+        if index is not None:
+            vertices = self._index.get_vertices()
+            begin, end = self._offsets[index], self._offsets[index + 1]
+            for target in self._targets[begin:end]:
+                yield vertices[target]
+
+    def get_predecessors(self, vertex: Vertex) -> typing.Iterator[Vertex]:
+        index = self.get_index(vertex)
+        if index is not None:
+            vertices = self._index.get_vertices()
+            offsets, sources = self.get_reverse_offsets(), self._reverse_sources
+            for source in sources[offsets[index]:offsets[index + 1]]:
+                yield vertices[source]
+
+    def get_edges(self,
+                  vertex: Vertex) -> typing.Optional[typing.Iterator[Edge]]:
+        index = self.get_index(vertex)
+        if index is not None:
+            return (Edge(adjacent, weight)
+                    for adjacent, weight in self.get_weighted_adjacent(vertex))
+        else:
+            return None
+
+    def get_weighted_adjacent(
+            self, vertex: Vertex) -> typing.Iterator[WeightedVertex]:
+        index = self.get_index(vertex)
+        if index is not None:
+            vertices, weights = self._index.get_vertices(), self._weights
+            begin, end = self._offsets[index], self._offsets[index + 1]
+            for position in range(begin, end):
+                weight = 1 if weights is None else weights[position]
+                yield vertices[self._targets[position]], weight
+
+    def get_degree(self, vertex: Vertex) -> int:
+        index = self.get_index(vertex)
+        if index is not None:
+            return self._offsets[index + 1] - self._offsets[index]
+
+        return 0
+
+    def get_index(self, vertex: Vertex) -> typing.Optional[int]:
+        return self._index.get_id(vertex.get_key())
+
+    def get_vertex_at(self, index: int) -> Vertex:
+        return self._index.get_vertex(index)
+
+    def get_vertex_index(self) -> VertexIndex:
+        return self._index
+
+    def get_csr(self) -> CSRGraph:
+        return self
+
+    def get_offsets(self) -> array.array:
+        return self._offsets
+
+    def get_targets(self) -> array.array:
+        return self._targets
+
+    def get_weights(self) -> typing.Optional[array.array]:
+        return self._weights
+
+    def get_reverse_offsets(self) -> array.array:
+        if self._reverse_offsets is None:
+            self._build_reverse()
+
+        return self._reverse_offsets
+
+    def get_reverse_sources(self) -> array.array:
+        if self._reverse_sources is None:
+            self._build_reverse()
+
+        return self._reverse_sources
+
+    def get_reversed(self) -> CSRGraph:
+        result = CSRGraph()
+        result._index = self._index
+
+        sources = array.array('q')
+        for index in range(len(self._index)):
+            degree = self._offsets[index + 1] - self._offsets[index]
+            sources.extend(array.array('q', [index]) * degree)
+        if self._weights is None:
+            weights = array.array('d', [1]) * len(self._targets)
+        else:
+            weights = array.array('d', self._weights)
+
+        result._compress(array.array('q', self._targets), sources, weights)
+
+        return result
+
+    def _build_reverse(self) -> None:
+        vertices_count = len(self._index)
+        offsets = array.array('q', bytes(8 * (vertices_count + 1)))
+        for target in self._targets:
+            offsets[target + 1] += 1
+        for index in range(vertices_count):
+            offsets[index + 1] += offsets[index]
+
+        positions = offsets[:-1]
+        typecode = memoryview(self._targets).format
+        sources = array.array(typecode, [0]) * len(self._targets)
+        for source in range(vertices_count):
+            begin, end = self._offsets[source], self._offsets[source + 1]
+            for target in self._targets[begin:end]:
+                sources[positions[target]] = source
+                positions[target] += 1
+
+        self._reverse_offsets = offsets
+        self._reverse_sources = sources
+
+    def _compress(self, sources: array.array, targets: array.array,
+                  weights: array.array) -> None:
+        vertices_count = len(self._index)
+        counts = array.array('q', bytes(8 * (vertices_count + 1)))
+        for source in sources:
+            counts[source + 1] += 1
+        for index in range(vertices_count):
+            counts[index + 1] += counts[index]
+
+        weighted = weights.count(1) != len(weights)
+        typecode = _get_index_typecode(vertices_count)
+        positions = counts[:-1]
+        placed = array.array(typecode, [0]) * len(targets)
+        placed_weights = array.array('d', [1]) * len(weights)
+        for position, source in enumerate(sources):
+            placed[positions[source]] = targets[position]
+            if weighted:
+                placed_weights[positions[source]] = weights[position]
+            positions[source] += 1
+
+        self._offsets = array.array('q', [0])
+        self._targets = array.array(typecode)
+        self._weights = array.array('d') if weighted else None
+        for index in range(vertices_count):
+            begin, end = counts[index], counts[index + 1]
+            if weighted:
+                seen = set()
+                for position in range(begin, end):
+                    target = placed[position]
+                    if target not in seen:
+                        seen.add(target)
+                        self._targets.append(target)
+                        self._weights.append(placed_weights[position])
+            else:
+                self._targets.extend(dict.fromkeys(placed[begin:end]))
+            self._offsets.append(len(self._targets))
+
+
+class VertexIndex(typing.Iterable, typing.Sized):
+    __slots__ = ['_vertices', '_ids']
+
+    def __init__(self) -> None:
+        self._vertices = []
+        self._ids = dict()
+
+    def __iter__(self) -> typing.Iterator[Vertex]:
+        return iter(self._vertices)
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    def __contains__(self, key: VertexKey) -> bool:
+        return key in self._ids
+
+    @classmethod
+    def from_keys(cls,
+                  keys: typing.Sequence[VertexKey],
+                  vertex_factory: typing.Optional[VertexFactory] = None,
+                  ids: typing.Optional[typing.Mapping[VertexKey, int]] = None
+                  ) -> VertexIndex:
+        result = cls()
+        result._vertices = _MappedVertices(keys, vertex_factory or Vertex)
+        result._ids = _MappedIds(keys) if ids is None else ids
+
+        return result
+
+    def copy(self) -> VertexIndex:
+        result = type(self)()
+        if isinstance(self._vertices, list):
+            result._vertices = list(self._vertices)
+            result._ids = dict(self._ids)
+        else:
+            result._vertices, result._ids = self._vertices, self._ids
+
+        return result
+
+    def add(self, vertex: Vertex) -> int:
+        key = vertex.get_key()
+        vertex_id = self._ids.get(key)
+        if vertex_id is None:
+            if not isinstance(self._vertices, list):
+                raise TypeError('Vertex index %r is read-only' % self)
+            vertex_id = len(self._vertices)
+            self._ids[key] = vertex_id
+            self._vertices.append(vertex)
+
+        return vertex_id
+
+    def require(self, vertex: Vertex) -> int:
+        vertex_id = self.add(vertex)
+        if self._vertices[vertex_id] != vertex:
+            raise WrongVertexException(vertex)
+
+        return vertex_id
+
+    def get_id(self, key: VertexKey) -> typing.Optional[int]:
+        return self._ids.get(key)
+
+    def get_ids(self, keys: typing.Iterable[VertexKey]) -> array.array:
+        ids = self._ids
+        return array.array('q', (ids.get(key, -1) for key in keys))
+
+    def get_vertex(self, vertex_id: int) -> Vertex:
+        return self._vertices[vertex_id]
+
+    def get_key(self, vertex_id: int) -> VertexKey:
+        return self._vertices[vertex_id].get_key()
+
+    def get_keys(self) -> typing.Iterator[VertexKey]:
+        return (vertex.get_key() for vertex in self._vertices)
+
+    def find_vertex(self, key: VertexKey) -> typing.Optional[Vertex]:
+        vertex_id = self._ids.get(key)
+        if vertex_id is not None:
+            return self._vertices[vertex_id]
+        else:
+            return None
+
+    def get_vertices(self) -> typing.Sequence[Vertex]:
+        return self._vertices
+
+
+class _MappedVertices(typing.Sequence):
+    __slots__ = ['_keys', '_vertex_factory', '_cache']
+
+    def __init__(self, keys: typing.Sequence[VertexKey],
+                 vertex_factory: VertexFactory) -> None:
+        self._keys = keys
+        self._vertex_factory = vertex_factory
+        self._cache = dict()
+
+    def __getitem__(self, index: int) -> Vertex:
+        vertex = self._cache.get(index)
+        if vertex is None:
+            vertex = self._vertex_factory(self._keys[index])
+            self._cache[index] = vertex
+
+        return vertex
+
+    def __iter__(self) -> typing.Iterator[Vertex]:
+        for index in range(len(self._keys)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _MappedIds(typing.Mapping):
+    __slots__ = ['_keys', '_ids']
+
+    def __init__(self, keys: typing.Sequence[VertexKey]) -> None:
+        self._keys = keys
+        self._ids = None
+
+    def __getitem__(self, key: VertexKey) -> int:
+        if isinstance(self._keys, range):
+            if type(key) is not int or key not in self._keys:
+                raise KeyError(key)
+            return key
+        if self._ids is None:
+            self._ids = {key: index for index, key in enumerate(self._keys)}
+
+        return self._ids[key]
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _SortedIds(typing.Mapping):
+    __slots__ = ['_sorted_keys', '_ids']
+
+    def __init__(self, sorted_keys: typing.Sequence[VertexKey],
+                 ids: typing.Sequence[int]) -> None:
+        self._sorted_keys = sorted_keys
+        self._ids = ids
+
+    def __getitem__(self, key: VertexKey) -> int:
+        try:
+            position = bisect.bisect_left(self._sorted_keys, key)
+        except TypeError:
+            raise KeyError(key) from None
+        if position == len(self._ids) or self._sorted_keys[position] != key:
+            raise KeyError(key)
+
+        return self._ids[position]
+
+    def __iter__(self) -> typing.Iterator[VertexKey]:
+        return iter(self._sorted_keys)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class _PermutedKeys(typing.Sequence):
+    __slots__ = ['_keys', '_order']
+
+    def __init__(self, keys: typing.Sequence[VertexKey],
+                 order: typing.Sequence[int]) -> None:
+        self._keys = keys
+        self._order = order
+
+    def __getitem__(self, position: int) -> VertexKey:
+        return self._keys[self._order[position]]
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+class _MappedStrings(typing.Sequence):
+    __slots__ = ['_offsets', '_data']
+
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self._offsets = offsets
+        self._data = data
+
+    def __getitem__(self, index: int) -> str:
+        begin, end = self._offsets[index], self._offsets[index + 1]
+
+        return str(self._data[begin:end], 'utf-8')
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
 class Vertex:
     __slots__ = '_key'
 
-    def __init__(self, key: int) -> None:
+    def __init__(self, key: VertexKey) -> None:
         self._key = key
 
-    def get_key(self):
+    def get_key(self) -> VertexKey:
         return self._key
 
 
 class AdjacentVerticesList(typing.Iterable):
-    __slots__ = '_sentinel', '_master_vertex'
+    __slots__ = '_sentinel', '_master_vertex', '_edges'
 
     def __init__(self, vertex: Vertex) -> None:
         self._master_vertex = vertex
         self._sentinel = SentinelEdge(vertex)
+        self._edges = dict()
 
     def __iter__(self):
         next_vertex = self._sentinel._next
@@ -148,30 +926,34 @@ class AdjacentVerticesList(typing.Iterable):
     def get_vertex(self) -> Vertex:
         return self._master_vertex
 
-    def add_adjacent(self, vertex: Vertex) -> None:
-        if not self.has_edge_with(vertex):
-            new_edge = Edge(vertex)
+    def add_adjacent(self, vertex: Vertex, weight: float = 1) -> None:
+        key = vertex.get_key()
+        if key not in self._edges:
+            new_edge = Edge(vertex, weight)
             new_edge._prev, new_edge._next = self._sentinel._prev, self._sentinel
             self._sentinel._prev._next = new_edge
             self._sentinel._prev = new_edge
+            self._edges[key] = new_edge
 
     def has_edge_with(self, vertex: Vertex) -> bool:
-        for edge in self:
-            if edge.get_vertex() == vertex:
-                return True
+        edge = self._edges.get(vertex.get_key())
 
-        return False
+        return edge is not None and edge.get_vertex() == vertex
 
 
 class Edge:
-    __slots__ = ['_vertex', '_prev', '_next']
+    __slots__ = ['_vertex', '_weight', '_prev', '_next']
 
-    def __init__(self, vertex: Vertex) -> None:
+    def __init__(self, vertex: Vertex, weight: float = 1) -> None:
         self._vertex = vertex
+        self._weight = weight
 
     def get_vertex(self) -> Vertex:
         return self._vertex
 
+    def get_weight(self) -> float:
+        return self._weight
+
 
 class SentinelEdge(Edge):
 
@@ -185,3 +967,34 @@ class WrongVertexException(Exception):
     def __init__(self, vertex: Vertex) -> None:
         super().__init__('Vertex with key: %s, %s is not in a graph' %
                          (vertex.get_key(), repr(vertex)))
+
+
+class ImmutableGraphException(Exception):
+
+    def __init__(self, graph: GraphInterface) -> None:
+        super().__init__('Graph %s can not be modified' % repr(graph))
+
+
+def _align(size: int) -> int:
+    return -(-size // 8) * 8
+
+
+def _get_index_typecode(vertices_count: int) -> str:
+    return 'i' if vertices_count < 2 ** 31 else 'q'
+
+
+def read_edges(
+        path: str,
+        chunk_size: int = EDGES_CHUNK_SIZE) -> typing.Iterator[EdgeTuple]:
+    with open(path) as edges_file:
+        lines = edges_file.readlines(chunk_size)
+        while lines:
+            for line in lines:
+                fields = line.replace(',', ' ').split()
+                if fields and not fields[0].startswith('#'):
+                    if len(fields) > 2:
+                        yield int(fields[0]), int(fields[1]), float(fields[2])
+                    else:
+                        yield int(fields[0]), int(fields[1])
+
+            lines = edges_file.readlines(chunk_size)
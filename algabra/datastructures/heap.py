@@ -4,7 +4,9 @@ import abc
 import math
 import typing
 
-import scipy.constants
+_GOLDEN_RATIO = (1 + math.sqrt(5)) / 2
+_SLOT_BITS = 32
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
 
 
 class AbstractHeap(abc.ABC):
@@ -39,19 +41,28 @@ class AbstractHeap(abc.ABC):
         pass
 
 
-class Heap(AbstractHeap):
-    __slots__ = '_heap', '_heap_size'
+class Heap(AbstractHeap, typing.Sized):
+    __slots__ = '_priorities', '_payloads', '_heap_size', '_key', '_aliased'
 
-    def __init__(self, input_data: typing.Iterable[int]) -> None:
-        self._heap = list(input_data)
-        self._heap_size = len(self._heap)
+    def __init__(self,
+                 input_data: typing.Iterable = (),
+                 key: typing.Optional[typing.Callable] = None) -> None:
+        self._payloads = list(input_data)
+        self._priorities = list(
+            self._payloads if key is None else map(key, self._payloads))
+        self._heap_size = len(self._payloads)
+        self._key = key
+        self._aliased = key is None
 
-        for index in range(math.floor((self._heap_size - 1) / 2), -1, -1):
+        for index in range((self._heap_size >> 1) - 1, -1, -1):
             self._heapify(index)
 
+    def __len__(self) -> int:
+        return self._heap_size
+
     @staticmethod
     def _parent(index: int) -> int:
-        return math.floor((index - 1) / 2)
+        return (index - 1) >> 1
 
     @staticmethod
     def _left(index: int) -> int:
@@ -62,93 +73,475 @@ class Heap(AbstractHeap):
         return 2 * index + 2
 
     @classmethod
-    def get_sorted_list(cls, unsorted_list: typing.Iterable[int]) -> list:
-        inner_heap = cls(unsorted_list)
-        for index in range(len(inner_heap._heap) - 1, 0, -1):
+    def get_sorted_list(cls,
+                        unsorted_list: typing.Iterable,
+                        key: typing.Optional[typing.Callable] = None) -> list:
+        inner_heap = cls(unsorted_list, key)
+        for index in range(inner_heap._heap_size - 1, 0, -1):
             inner_heap._swap(0, index)
             inner_heap._heap_size -= 1
             inner_heap._heapify(0)
 
-        return inner_heap._heap
+        return inner_heap._payloads
 
-    def get_highest(self) -> int:
-        return self._heap[0]
+    def get_highest(self):
+        return self._payloads[0]
 
-    def extract_highest(self) -> typing.Optional[int]:
+    def get_highest_priority(self):
+        return self._priorities[0]
+
+    def extract_highest(self):
         if self._heap_size < 1:
             return None
-        result = self._heap[0]
-        self._heap[0] = self._heap[self._heap_size - 1]
+
+        result = self._payloads[0]
+        last_priority = self._priorities.pop()
+        last_payload = self._payloads.pop()
         self._heap_size -= 1
-        self._heapify(0)
+        if self._heap_size:
+            self._priorities[0] = last_priority
+            self._payloads[0] = last_payload
+            self._heapify(0)
 
         return result
 
-    def promote_key(self, index: int, new_value: int) -> None:
+    def promote_key(self, index: int, new_value) -> None:
         super().promote_key(index, new_value)
 
-        self._heap[index] = new_value
+        if self._aliased:
+            self._payloads[index] = new_value
+        self._priorities[index] = new_value
         self._sift_up(index)
 
-    def insert(self, value: int) -> None:
+    def insert(self, value) -> None:
+        if self._key is None:
+            if not self._aliased:
+                self._set_aliased(True)
+            self._push(value, value)
+        else:
+            self._push(self._key(value), value)
+
+    def push(self, priority, payload) -> None:
+        if self._aliased:
+            self._set_aliased(False)
+        self._push(priority, payload)
+
+    def _push(self, priority, payload) -> None:
+        self._priorities.append(priority)
+        self._payloads.append(payload)
         self._heap_size += 1
-        self._heap.append(value)
         self._sift_up(self._heap_size - 1)
 
-    def get_value(self, item: int) -> int:
-        return self._heap[item]
+    def push_many(self, values: typing.Iterable) -> None:
+        if self._key is None and not self._aliased:
+            self._set_aliased(True)
+        payloads = list(values)
+        priorities = payloads if self._key is None else list(
+            map(self._key, payloads))
+        first = self._heap_size
+        self._priorities.extend(priorities)
+        self._payloads.extend(payloads)
+        self._heap_size += len(payloads)
+
+        if len(payloads) * self._heap_size.bit_length() > self._heap_size:
+            for index in range((self._heap_size >> 1) - 1, -1, -1):
+                self._heapify(index)
+        else:
+            for index in range(first, self._heap_size):
+                self._sift_up(index)
 
-    def _sift_up(self, index: int) -> None:
-        while index > 0 and not self._index_higher(self._parent(index), index):
-            parent = self._parent(index)
-            self._swap(parent, index)
-            index = parent
+    def pop_many(self, count: int) -> list:
+        extract = self.extract_highest
+        return [extract() for _ in range(min(count, self._heap_size))]
 
-    def _heapify(self, index: int) -> None:
-        iterate = True
-        while iterate:
-            left = self._left(index)
-            right = self._right(index)
-            highest = index
+    def replace_highest(self, value):
+        if self._key is None and not self._aliased:
+            self._set_aliased(True)
+        return self._replace_highest(
+            value if self._key is None else self._key(value), value)
 
-            if self._in_heap(left) and self._index_higher(left, index):
-                highest = left
+    def get_value(self, item: int):
+        return self._priorities[item]
 
-            if self._in_heap(right) and self._index_higher(right, highest):
-                highest = right
+    def _replace_highest(self, priority, payload):
+        if self._heap_size < 1:
+            self._push(priority, payload)
+            return None
 
-            if highest != index:
-                self._swap(highest, index)
-                index = highest
-            else:
-                iterate = False
+        result = self._payloads[0]
+        self._priorities[0] = priority
+        self._payloads[0] = payload
+        self._heapify(0)
+
+        return result
+
+    def get_payload(self, item: int):
+        return self._payloads[item]
+
+    def _set_aliased(self, aliased: bool) -> None:
+        if self._heap_size:
+            raise TypeError('Heap without a key cannot mix inserted values '
+                            'with pushed payloads')
+        self._aliased = aliased
+
+    def _sift_up(self, index: int) -> None:
+        priorities, payloads = self._priorities, self._payloads
+        priority, payload = priorities[index], payloads[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not self._is_higher(priority, priorities[parent]):
+                break
+            priorities[index] = priorities[parent]
+            payloads[index] = payloads[parent]
+            index = parent
+
+        priorities[index] = priority
+        payloads[index] = payload
+
+    def _heapify(self, index: int) -> None:
+        priorities, payloads = self._priorities, self._payloads
+        size = self._heap_size
+        priority, payload = priorities[index], payloads[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and self._is_higher(priorities[right],
+                                                priorities[child]):
+                child = right
+            if not self._is_higher(priorities[child], priority):
+                break
+            priorities[index] = priorities[child]
+            payloads[index] = payloads[child]
+            index = child
+            child = 2 * index + 1
+
+        priorities[index] = priority
+        payloads[index] = payload
 
     def _index_higher(self, one: int, other: int) -> bool:
-        return self._is_higher(self._heap[one], self._heap[other])
+        return self._is_higher(self._priorities[one], self._priorities[other])
 
     def _in_heap(self, index: int) -> bool:
         return index < self._heap_size
 
     def _swap(self, first: int, second: int) -> None:
-        first_value = self._heap[first]
-        self._heap[first] = self._heap[second]
-        self._heap[second] = first_value
+        priorities, payloads = self._priorities, self._payloads
+        priorities[first], priorities[second] = \
+            priorities[second], priorities[first]
+        payloads[first], payloads[second] = payloads[second], payloads[first]
 
 
 class MaxHeap(Heap):
 
     @classmethod
-    def _is_higher(cls, one: int, other: int) -> bool:
+    def _is_higher(cls, one, other) -> bool:
         return one > other
 
+    def _sift_up(self, index: int) -> None:
+        priorities, payloads = self._priorities, self._payloads
+        priority, payload = priorities[index], payloads[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not priority > priorities[parent]:
+                break
+            priorities[index] = priorities[parent]
+            payloads[index] = payloads[parent]
+            index = parent
+
+        priorities[index] = priority
+        payloads[index] = payload
+
+    def _heapify(self, index: int) -> None:
+        priorities, payloads = self._priorities, self._payloads
+        size = self._heap_size
+        priority, payload = priorities[index], payloads[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and priorities[right] > priorities[child]:
+                child = right
+            if not priorities[child] > priority:
+                break
+            priorities[index] = priorities[child]
+            payloads[index] = payloads[child]
+            index = child
+            child = 2 * index + 1
+
+        priorities[index] = priority
+        payloads[index] = payload
+
 
 class MinHeap(Heap):
 
+    @classmethod
+    def _is_higher(cls, one, other) -> bool:
+        return one < other
+
+    def _sift_up(self, index: int) -> None:
+        priorities, payloads = self._priorities, self._payloads
+        priority, payload = priorities[index], payloads[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            priorities[index] = priorities[parent]
+            payloads[index] = payloads[parent]
+            index = parent
+
+        priorities[index] = priority
+        payloads[index] = payload
+
+    def _heapify(self, index: int) -> None:
+        priorities, payloads = self._priorities, self._payloads
+        size = self._heap_size
+        priority, payload = priorities[index], payloads[index]
+        child = 2 * index + 1
+        while child < size:
+            right = child + 1
+            if right < size and priorities[right] < priorities[child]:
+                child = right
+            if not priorities[child] < priority:
+                break
+            priorities[index] = priorities[child]
+            payloads[index] = payloads[child]
+            index = child
+            child = 2 * index + 1
+
+        priorities[index] = priority
+        payloads[index] = payload
+
+
+def nlargest(count: int,
+             iterable: typing.Iterable,
+             key: typing.Optional[typing.Callable] = None) -> list:
+    return _select(MinHeap, count, iterable, key)
+
+
+def nsmallest(count: int,
+              iterable: typing.Iterable,
+              key: typing.Optional[typing.Callable] = None) -> list:
+    return _select(MaxHeap, count, iterable, key)
+
+
+def top_k(iterable: typing.Iterable,
+          count: int,
+          key: typing.Optional[typing.Callable] = None) -> list:
+    return nlargest(count, iterable, key)
+
+
+def _select(heap_type: typing.Type[Heap], count: int,
+            iterable: typing.Iterable,
+            key: typing.Optional[typing.Callable]) -> list:
+    if count <= 0:
+        return []
+
+    heap = heap_type()
+    is_higher = heap_type._is_higher
+    for value in iterable:
+        priority = value if key is None else key(value)
+        if len(heap) < count:
+            heap.push(priority, value)
+        elif is_higher(heap.get_highest_priority(), priority):
+            heap._replace_highest(priority, value)
+
+    result = heap.pop_many(count)
+    result.reverse()
+
+    return result
+
+
+def merge(*sorted_iterables: typing.Iterable,
+          key: typing.Optional[typing.Callable] = None) -> typing.Iterator:
+    heap = MinHeap()
+    for order, iterable in enumerate(sorted_iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.push((value if key is None else key(value), order),
+                      (value, iterator, order))
+            break
+
+    while len(heap):
+        value, iterator, order = heap.get_highest()
+        yield value
+        for value in iterator:
+            heap._replace_highest(
+                (value if key is None else key(value), order),
+                (value, iterator, order))
+            break
+        else:
+            heap.extract_highest()
+
+
+class IndexedHeap(AbstractHeap, typing.Sized):
+    __slots__ = [
+        '_values',
+        '_slots',
+        '_positions',
+        '_generations',
+        '_free_slots',
+        '_arity',
+    ]
+
+    def __init__(self, arity: int = 4) -> None:
+        if arity < 2:
+            raise ValueError('Heap arity must be at least 2, got %d' % arity)
+
+        self._values = []
+        self._slots = []
+        self._positions = []
+        self._generations = []
+        self._free_slots = []
+        self._arity = arity
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, handle: int) -> bool:
+        return self.contains(handle)
+
+    def get_highest(self) -> typing.Optional[int]:
+        return self._values[0] if self._values else None
+
+    def get_highest_handle(self) -> typing.Optional[int]:
+        return self._get_handle(self._slots[0]) if self._slots else None
+
+    def extract_highest(self) -> typing.Optional[int]:
+        if not self._values:
+            return None
+
+        result = self._values[0]
+        self._release(self._slots[0])
+        last_value = self._values.pop()
+        last_slot = self._slots.pop()
+        if self._values:
+            self._values[0] = last_value
+            self._slots[0] = last_slot
+            self._positions[last_slot] = 0
+            self._heapify(0)
+
+        return result
+
+    def promote_key(self, handle: int, new_value: int) -> None:
+        super().promote_key(handle, new_value)
+
+        position = self._positions[handle & _SLOT_MASK]
+        self._values[position] = new_value
+        self._sift_up(position)
+
+    def delete(self, handle: int) -> int:
+        slot = self._require_slot(handle)
+        position = self._positions[slot]
+        result = self._values[position]
+        self._release(slot)
+        last_value = self._values.pop()
+        last_slot = self._slots.pop()
+        if position < len(self._values):
+            self._values[position] = last_value
+            self._slots[position] = last_slot
+            self._positions[last_slot] = position
+            if position and self._is_higher(
+                    last_value, self._values[(position - 1) // self._arity]):
+                self._sift_up(position)
+            else:
+                self._heapify(position)
+
+        return result
+
+    def contains(self, handle: int) -> bool:
+        slot = handle & _SLOT_MASK
+
+        return slot < len(self._positions) and \
+            self._positions[slot] >= 0 and \
+            self._generations[slot] == handle >> _SLOT_BITS
+
+    def insert(self, value: int) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._positions)
+            self._positions.append(-1)
+            self._generations.append(0)
+        self._positions[slot] = len(self._values)
+        self._values.append(value)
+        self._slots.append(slot)
+        self._sift_up(len(self._values) - 1)
+
+        return self._get_handle(slot)
+
+    def get_value(self, handle: int) -> int:
+        return self._values[self._positions[self._require_slot(handle)]]
+
+    def _get_handle(self, slot: int) -> int:
+        return self._generations[slot] << _SLOT_BITS | slot
+
+    def _release(self, slot: int) -> None:
+        self._positions[slot] = -1
+        self._generations[slot] += 1
+        self._free_slots.append(slot)
+
+    def _require_slot(self, handle: int) -> int:
+        if not self.contains(handle):
+            raise KeyError('Handle %d is not in the heap' % handle)
+
+        return handle & _SLOT_MASK
+
+    def _sift_up(self, position: int) -> None:
+        values, slots = self._values, self._slots
+        positions, arity = self._positions, self._arity
+        is_higher = self._is_higher
+        value, slot = values[position], slots[position]
+        while position > 0:
+            parent = (position - 1) // arity
+            if not is_higher(value, values[parent]):
+                break
+            values[position] = values[parent]
+            slots[position] = slots[parent]
+            positions[slots[position]] = position
+            position = parent
+
+        values[position] = value
+        slots[position] = slot
+        positions[slot] = position
+
+    def _heapify(self, position: int) -> None:
+        values, slots = self._values, self._slots
+        positions, arity = self._positions, self._arity
+        is_higher = self._is_higher
+        size = len(values)
+        value, slot = values[position], slots[position]
+        first = arity * position + 1
+        while first < size:
+            child = first
+            for sibling in range(first + 1, min(first + arity, size)):
+                if is_higher(values[sibling], values[child]):
+                    child = sibling
+            if not is_higher(values[child], value):
+                break
+            values[position] = values[child]
+            slots[position] = slots[child]
+            positions[slots[position]] = position
+            position = child
+            first = arity * position + 1
+
+        values[position] = value
+        slots[position] = slot
+        positions[slot] = position
+
+
+class IndexedMinHeap(IndexedHeap):
+
     @classmethod
     def _is_higher(cls, one: int, other: int) -> bool:
         return one < other
 
 
+class IndexedMaxHeap(IndexedHeap):
+
+    @classmethod
+    def _is_higher(cls, one: int, other: int) -> bool:
+        return one > other
+
+
 class FibonacciHeap(AbstractHeap, typing.Sized):
     __slots__ = '_highest', '_nodes_count'
 
@@ -186,43 +579,6 @@ class FibonacciHeap(AbstractHeap, typing.Sized):
 
         node._left = node._right = None
 
-    @staticmethod
-    def _exchange_roots(one: FibonacciHeapNode,
-                        other: FibonacciHeapNode) -> None:
-        other_around_one = one._left == other and one._right == other
-        one_around_other = other._left == one and other._right == one
-        if other_around_one != one_around_other:
-            raise Exception(
-                'List is broken on nodes %d and %d' % (one._key, other._key))
-
-        if one == other or other_around_one:
-            return
-
-        one_adjacent_other = one._right == other and other._left == one
-        other_adjacent_one = one._left == other and other._right == one
-        are_adjacent = one_adjacent_other or other_adjacent_one
-
-        if other._right == one:
-            one, other = other, one
-
-        swapper_vector = one._left, other._left, one._right, other._right
-
-        if are_adjacent:
-            one._left = swapper_vector[2]
-            other._left = swapper_vector[0]
-            one._right = swapper_vector[3]
-            other._right = swapper_vector[1]
-        else:
-            one._left = swapper_vector[1]
-            other._left = swapper_vector[0]
-            one._right = swapper_vector[3]
-            other._right = swapper_vector[2]
-
-        one._left._right = one
-        one._right._left = one
-        other._left._right = other
-        other._right._left = other
-
     @classmethod
     def union(cls, one: FibonacciHeap, other: FibonacciHeap) -> FibonacciHeap:
         result = cls()
@@ -274,6 +630,9 @@ class FibonacciHeap(AbstractHeap, typing.Sized):
 
         return None if result is None else result
 
+    def extract_highest_node(self) -> typing.Optional[FibonacciHeapNode]:
+        return self._extract_highest_node()
+
     def extract_highest(self) -> typing.Optional[int]:
         result = self._extract_highest_node()
 
@@ -316,33 +675,31 @@ class FibonacciHeap(AbstractHeap, typing.Sized):
                 iterate = False
 
     def _consolidate(self) -> None:
-        nodes_per_degree = [None] * self._get_max_degrees_count()
+        roots = []
+        node = self._highest
+        while True:
+            roots.append(node)
+            node = node._right
+            if node is self._highest:
+                break
 
-        terminal = False
-        next_node = self._highest
-        while next_node != terminal and next_node is not None:
-            terminal = next_node if not terminal else terminal
-            degree = next_node._degree
-            while nodes_per_degree[degree] is not None:
-                same_degree_node = nodes_per_degree[degree]
-
-                if self._is_higher(same_degree_node, next_node):
-                    if terminal == same_degree_node:
-                        terminal = same_degree_node._right
-                    self._exchange_roots(next_node, same_degree_node)
-                    next_node, same_degree_node = same_degree_node, next_node
+        nodes_per_degree = [None] * self._get_max_degrees_count()
+        for node in roots:
+            degree = node._degree
+            same_degree_node = nodes_per_degree[degree]
+            while same_degree_node is not None:
+                if self._is_higher(same_degree_node, node):
+                    node, same_degree_node = same_degree_node, node
 
-                if terminal == same_degree_node:
-                    terminal = same_degree_node._right
                 self._remove_from_root_list(same_degree_node)
-                next_node._add_child(same_degree_node)
+                node._add_child(same_degree_node)
                 same_degree_node._mark = False
 
                 nodes_per_degree[degree] = None
                 degree += 1
+                same_degree_node = nodes_per_degree[degree]
 
-            nodes_per_degree[degree] = next_node
-            next_node = next_node._right
+            nodes_per_degree[degree] = node
 
         self._highest = None
         for node in nodes_per_degree:
@@ -350,7 +707,7 @@ class FibonacciHeap(AbstractHeap, typing.Sized):
                 self._insert_in_root_list(node)
 
     def _get_max_degrees_count(self) -> int:
-        return math.floor(math.log(self._nodes_count, scipy.constants.golden))
+        return int(math.log(max(self._nodes_count, 1), _GOLDEN_RATIO)) + 2
 
     def _insert_in_root_list(self, node: FibonacciHeapNode):
         node._parent = None
@@ -448,3 +805,264 @@ class MaxFibonacciHeap(FibonacciHeap):
 
     def _promote_value(self, key: int, level: typing.Optional[int] = 1) -> int:
         return key + level
+
+
+class PairingHeap(AbstractHeap, typing.Sized):
+    __slots__ = '_root', '_nodes_count'
+
+    def __init__(self) -> None:
+        self._root = None
+        self._nodes_count = 0
+
+    def __len__(self) -> int:
+        return self._nodes_count
+
+    @classmethod
+    def union(cls, one: PairingHeap, other: PairingHeap) -> PairingHeap:
+        result = cls()
+        result._root = result._meld(one._root, other._root)
+        result._nodes_count = one._nodes_count + other._nodes_count
+
+        return result
+
+    def insert(self, node: PairingHeapNode) -> None:
+        node._child = node._sibling = node._prev = None
+        self._root = self._meld(self._root, node)
+        self._nodes_count += 1
+
+    def get_highest(self) -> typing.Optional[int]:
+        return None if self._root is None else self._root._key
+
+    def extract_highest_node(self) -> typing.Optional[PairingHeapNode]:
+        result = self._root
+        if result is not None:
+            self._root = self._merge_pairs(result._child)
+            result._child = None
+            self._nodes_count -= 1
+
+        return result
+
+    def extract_highest(self) -> typing.Optional[int]:
+        result = self.extract_highest_node()
+
+        return None if result is None else result._key
+
+    def promote_key(self, node: PairingHeapNode, new_value: int) -> None:
+        self._require_node(node)
+        super().promote_key(node, new_value)
+
+        node._key = new_value
+        if node is not self._root:
+            self._detach(node)
+            self._root = self._meld(self._root, node)
+
+    def delete(self, node: PairingHeapNode) -> None:
+        if node is self._root:
+            self.extract_highest_node()
+            return
+
+        self._require_node(node)
+        self._detach(node)
+        subtree = self._merge_pairs(node._child)
+        node._child = None
+        self._root = self._meld(self._root, subtree)
+        self._nodes_count -= 1
+
+    def get_value(self, node: PairingHeapNode) -> typing.Optional[int]:
+        return None if node is None else node._key
+
+    @classmethod
+    def _meld(
+        cls, one: typing.Optional[PairingHeapNode],
+        other: typing.Optional[PairingHeapNode]
+    ) -> typing.Optional[PairingHeapNode]:
+        if one is None:
+            return other
+        if other is None:
+            return one
+        if cls._is_higher(other._key, one._key):
+            one, other = other, one
+
+        other._prev = one
+        other._sibling = one._child
+        if one._child is not None:
+            one._child._prev = other
+        one._child = other
+
+        return one
+
+    def _merge_pairs(
+        self, first: typing.Optional[PairingHeapNode]
+    ) -> typing.Optional[PairingHeapNode]:
+        pairs = []
+        while first is not None:
+            second = first._sibling
+            following = None if second is None else second._sibling
+            first._sibling = first._prev = None
+            if second is not None:
+                second._sibling = second._prev = None
+            pairs.append(self._meld(first, second))
+            first = following
+
+        result = None
+        for subtree in reversed(pairs):
+            result = self._meld(subtree, result)
+        if result is not None:
+            result._prev = None
+
+        return result
+
+    def _require_node(self, node: PairingHeapNode) -> None:
+        if node is not self._root and node._prev is None:
+            raise KeyError('Node %r is not in the heap' % node._key)
+
+    @staticmethod
+    def _detach(node: PairingHeapNode) -> None:
+        if node._prev._child is node:
+            node._prev._child = node._sibling
+        else:
+            node._prev._sibling = node._sibling
+        if node._sibling is not None:
+            node._sibling._prev = node._prev
+
+        node._prev = node._sibling = None
+
+
+class PairingHeapNode:
+    __slots__ = '_key', '_child', '_sibling', '_prev'
+
+    def __init__(self, key: int) -> None:
+        self._key = key
+        self._child = None
+        self._sibling = None
+        self._prev = None
+
+
+class MinPairingHeap(PairingHeap):
+
+    @classmethod
+    def _is_higher(cls, one: int, other: int) -> bool:
+        return one < other
+
+
+class MaxPairingHeap(PairingHeap):
+
+    @classmethod
+    def _is_higher(cls, one: int, other: int) -> bool:
+        return one > other
+
+
+class RadixHeap(AbstractHeap, typing.Sized):
+    __slots__ = '_buckets', '_last', '_nodes_count'
+
+    def __init__(self) -> None:
+        self._buckets = [set()]
+        self._last = 0
+        self._nodes_count = 0
+
+    def __len__(self) -> int:
+        return self._nodes_count
+
+    @classmethod
+    def _is_higher(cls, one: int, other: int) -> bool:
+        return one < other
+
+    @classmethod
+    def union(cls, one: RadixHeap, other: RadixHeap) -> RadixHeap:
+        result = cls()
+        result._last = min(one._last, other._last)
+        for heap in (one, other):
+            for bucket in heap._buckets:
+                for node in bucket:
+                    result._place(node, int(node._key))
+        result._nodes_count = one._nodes_count + other._nodes_count
+
+        return result
+
+    def insert(self, node: RadixHeapNode) -> None:
+        if not self._nodes_count:
+            self._last = 0
+        self._place(node, self._require_key(node._key))
+        self._nodes_count += 1
+
+    def get_highest(self) -> typing.Optional[int]:
+        for bucket in self._buckets:
+            if bucket:
+                return min(node._key for node in bucket)
+
+        return None
+
+    def extract_highest_node(self) -> typing.Optional[RadixHeapNode]:
+        if not self._nodes_count:
+            return None
+
+        buckets = self._buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            bucket = buckets[index]
+            buckets[index] = set()
+            self._last = min(int(node._key) for node in bucket)
+            for node in bucket:
+                self._place(node, int(node._key))
+
+        result = buckets[0].pop()
+        result._bucket = -1
+        self._nodes_count -= 1
+
+        return result
+
+    def extract_highest(self) -> typing.Optional[int]:
+        result = self.extract_highest_node()
+
+        return None if result is None else result._key
+
+    def promote_key(self, node: RadixHeapNode, new_value: int) -> None:
+        bucket = self._require_bucket(node)
+        super().promote_key(node, new_value)
+
+        key = self._require_key(new_value)
+        bucket.remove(node)
+        node._key = new_value
+        self._place(node, key)
+
+    def delete(self, node: RadixHeapNode) -> None:
+        self._require_bucket(node).remove(node)
+        node._bucket = -1
+        self._nodes_count -= 1
+
+    def get_value(self, node: RadixHeapNode) -> typing.Optional[int]:
+        return None if node is None else node._key
+
+    def _place(self, node: RadixHeapNode, key: int) -> None:
+        position = (key ^ self._last).bit_length()
+        while len(self._buckets) <= position:
+            self._buckets.append(set())
+        self._buckets[position].add(node)
+        node._bucket = position
+
+    def _require_bucket(self, node: RadixHeapNode) -> set:
+        if (node._bucket < 0 or node._bucket >= len(self._buckets) or
+                node not in self._buckets[node._bucket]):
+            raise KeyError('Node %r is not in the heap' % node._key)
+
+        return self._buckets[node._bucket]
+
+    def _require_key(self, key: int) -> int:
+        if key < 0 or key != int(key):
+            raise ValueError('Radix heap keys must be non-negative integers, '
+                             'got %r' % key)
+        if key < self._last:
+            raise ValueError('Radix heap key %r is below the last extracted '
+                             'key %d' % (key, self._last))
+
+        return int(key)
+
+
+class RadixHeapNode:
+    __slots__ = '_key', '_bucket'
+
+    def __init__(self, key: int) -> None:
+        self._key = key
+        self._bucket = -1
@@ -0,0 +1,58 @@
+import argparse
+import time
+
+import algabra.datastructures.graph as mygraph
+import benchmarks.generators as generators
+
+
+class LinearAdjacentVerticesList(mygraph.AdjacentVerticesList):
+
+    def add_adjacent(self, vertex: mygraph.Vertex, weight: float = 1) -> None:
+        if not self.has_edge_with(vertex):
+            new_edge = mygraph.Edge(vertex, weight)
+            new_edge._prev, new_edge._next = self._sentinel._prev, self._sentinel
+            self._sentinel._prev._next = new_edge
+            self._sentinel._prev = new_edge
+
+    def has_edge_with(self, vertex: mygraph.Vertex) -> bool:
+        for edge in self:
+            if edge.get_vertex() == vertex:
+                return True
+
+        return False
+
+
+class LinearAdjacencyListGraph(mygraph.AdjacencyListGraph):
+
+    def _append(self, vertex: mygraph.Vertex) -> int:
+        self._vertices.append(LinearAdjacentVerticesList(vertex))
+
+        return self._index.add(vertex)
+
+
+def load(graph: mygraph.AdjacencyListGraph, edges: list) -> float:
+    vertices = dict()
+    started = time.perf_counter()
+    for key_from, key_to in edges:
+        if key_from not in vertices:
+            vertices[key_from] = mygraph.Vertex(key_from)
+        if key_to not in vertices:
+            vertices[key_to] = mygraph.Vertex(key_to)
+        graph.add_edge(vertices[key_from], vertices[key_to])
+
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--edges', type=int, default=1000000)
+    arguments = parser.parse_args()
+
+    edges = list(generators.scale_free_edges(arguments.edges))
+    print('Loading %d edges of a scale-free graph' % len(edges))
+    print('hash index:  %.2fs' % load(mygraph.AdjacencyListGraph(), edges))
+    print('linear scan: %.2fs' % load(LinearAdjacencyListGraph(), edges))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import time
+
+import algabra.algorithms.graph as graphsalgs
+import algabra.datastructures.graph as mygraph
+import benchmarks.generators as generators
+
+
+def measure(traversal, graph: mygraph.CSRGraph, roots: list) -> float:
+    started = time.perf_counter()
+    for root in roots:
+        traversal(graph, root)
+
+    return (time.perf_counter() - started) / len(roots)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=int, default=16)
+    parser.add_argument('--edge-factor', type=int, default=16)
+    parser.add_argument('--roots', type=int, default=8)
+    arguments = parser.parse_args()
+
+    graph = mygraph.CSRGraph.from_edges(
+        generators.rmat_edges(arguments.scale, arguments.edge_factor))
+    graph.get_reverse_offsets()
+    step = max(1, len(graph) // arguments.roots)
+    roots = [graph.get_vertex_at(index) for index in range(0, len(graph), step)]
+    print('RMAT scale %d: %d vertices, %d edges' %
+          (arguments.scale, len(graph), len(graph.get_targets())))
+
+    print('top-down:            %.3fs' %
+          measure(graphsalgs.breadth_first_traversal, graph, roots))
+    print('direction-optimized: %.3fs' %
+          measure(graphsalgs.direction_optimizing_traversal, graph, roots))
+
+
+if __name__ == '__main__':
+    main()
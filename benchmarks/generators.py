@@ -0,0 +1,80 @@
+import random
+import typing
+
+
+def scale_free_edges(edges_count: int,
+                     edges_per_vertex: int = 4,
+                     seed: int = 0) -> typing.Iterator[typing.Tuple[int, int]]:
+    generator = random.Random(seed)
+    endpoints = list(range(edges_per_vertex + 1))
+    vertex = edges_per_vertex + 1
+    produced = 0
+
+    while produced < edges_count:
+        targets = set()
+        while len(targets) < edges_per_vertex:
+            targets.add(generator.choice(endpoints))
+
+        for target in targets:
+            yield vertex, target
+            yield target, vertex
+            endpoints.append(target)
+            endpoints.append(vertex)
+            produced += 2
+
+        vertex += 1
+
+
+def rmat_edges(scale: int,
+               edge_factor: int = 16,
+               probabilities: typing.Tuple[float, float, float] = (0.57, 0.19,
+                                                                    0.19),
+               seed: int = 0) -> typing.Iterator[typing.Tuple[int, int]]:
+    generator = random.Random(seed)
+    a, b, c = probabilities
+    for _ in range(edge_factor << scale):
+        source = target = 0
+        for _ in range(scale):
+            chance = generator.random()
+            source <<= 1
+            target <<= 1
+            if chance < a:
+                pass
+            elif chance < a + b:
+                target |= 1
+            elif chance < a + b + c:
+                source |= 1
+            else:
+                source |= 1
+                target |= 1
+
+        if source != target:
+            yield source, target
+            yield target, source
+
+
+def grid_edges(side: int, seed: int = 0
+               ) -> typing.Iterator[typing.Tuple[int, int, float]]:
+    generator = random.Random(seed)
+    for row in range(side):
+        for column in range(side):
+            vertex = row * side + column
+            neighbours = []
+            if column + 1 < side:
+                neighbours.append(vertex + 1)
+            if row + 1 < side:
+                neighbours.append(vertex + side)
+            for neighbour in neighbours:
+                weight = generator.randint(1, 100)
+                yield vertex, neighbour, weight
+                yield neighbour, vertex, weight
+
+
+def dense_edges(vertices_count: int, seed: int = 0
+                ) -> typing.Iterator[typing.Tuple[int, int, float]]:
+    generator = random.Random(seed)
+    for vertex in range(vertices_count):
+        for neighbour in range(vertex + 1, vertices_count):
+            weight = generator.randint(1, 100)
+            yield vertex, neighbour, weight
+            yield neighbour, vertex, weight
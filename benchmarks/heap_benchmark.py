@@ -0,0 +1,105 @@
+import argparse
+import random
+import time
+
+import algabra.datastructures.heap as myheap
+
+HEAP_TYPES = [
+    myheap.MinHeap,
+    myheap.IndexedMinHeap,
+    myheap.MinFibonacciHeap,
+    myheap.MinPairingHeap,
+    myheap.RadixHeap,
+]
+NODE_TYPES = {
+    myheap.MinFibonacciHeap: myheap.FibonacciHeapNode,
+    myheap.MinPairingHeap: myheap.PairingHeapNode,
+    myheap.RadixHeap: myheap.RadixHeapNode,
+}
+
+
+def fill(heap_type, values):
+    heap = heap_type()
+    if issubclass(heap_type, myheap.IndexedHeap):
+        return heap, [heap.insert(value) for value in values]
+
+    node_type = NODE_TYPES.get(heap_type)
+    if node_type is None:
+        for value in values:
+            heap.insert(value)
+        return heap, None
+
+    handles = [node_type(value) for value in values]
+    for handle in handles:
+        heap.insert(handle)
+
+    return heap, handles
+
+
+def insert_heavy(heap_type, values, generator) -> None:
+    heap, _ = fill(heap_type, values)
+    for _ in range(len(values) // 10):
+        heap.extract_highest()
+
+
+def extract_heavy(heap_type, values, generator) -> None:
+    heap, _ = fill(heap_type, values)
+    while heap.extract_highest() is not None:
+        pass
+
+
+def decrease_key_heavy(heap_type, values, generator) -> None:
+    heap, live = fill(heap_type, values)
+    positions = {handle: position for position, handle in enumerate(live)}
+    indexed = issubclass(heap_type, myheap.IndexedHeap)
+    floor = 0
+    while live:
+        for _ in range(4):
+            handle = live[generator.randrange(len(live))]
+            value = heap.get_value(handle)
+            if value > floor:
+                heap.promote_key(
+                    handle, max(floor, value - generator.randrange(1, 100)))
+
+        floor = heap.get_highest()
+        if indexed:
+            extracted = heap.get_highest_handle()
+            heap.extract_highest()
+        else:
+            extracted = heap.extract_highest_node()
+        position = positions.pop(extracted)
+        last = live.pop()
+        if last != extracted:
+            live[position] = last
+            positions[last] = position
+
+
+WORKLOADS = [
+    ('insert-heavy', insert_heavy, HEAP_TYPES),
+    ('extract-heavy', extract_heavy, HEAP_TYPES),
+    ('decrease-key-heavy', decrease_key_heavy, HEAP_TYPES[1:]),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes',
+                        default='10000,100000',
+                        help='comma separated heap sizes, e.g. up to 10000000')
+    arguments = parser.parse_args()
+
+    for size in map(int, arguments.sizes.split(',')):
+        generator = random.Random(size)
+        values = [generator.randrange(size * 100) for _ in range(size)]
+        print('%d elements' % size)
+        for name, workload, heap_types in WORKLOADS:
+            for heap_type in heap_types:
+                started = time.perf_counter()
+                workload(heap_type, values, generator)
+                print('  %-20s %-18s %.3fs' %
+                      (name, heap_type.__name__,
+                       time.perf_counter() - started))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import argparse
+import time
+
+import algabra.algorithms.graph as graphsalgs
+import algabra.datastructures.graph as mygraph
+import benchmarks.generators as generators
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=int, default=18)
+    parser.add_argument('--edge-factor', type=int, default=16)
+    parser.add_argument('--workers',
+                        type=int,
+                        nargs='+',
+                        default=[1, 2, 4, 8, 16])
+    arguments = parser.parse_args()
+
+    graph = mygraph.CSRGraph.from_edges(
+        generators.rmat_edges(arguments.scale, arguments.edge_factor))
+    root = graph.get_vertex_at(0)
+    print('RMAT scale %d: %d vertices, %d edges' %
+          (arguments.scale, len(graph), len(graph.get_targets())))
+
+    started = time.perf_counter()
+    expected = graphsalgs.breadth_first_traversal(graph, root)
+    print('sequential:  %.3fs' % (time.perf_counter() - started))
+
+    for workers in arguments.workers:
+        started = time.perf_counter()
+        result = graphsalgs.parallel_breadth_first_traversal(
+            graph, root, workers)
+        elapsed = time.perf_counter() - started
+        assert result.get_parents() == expected.get_parents()
+        print('%2d workers:  %.3fs' % (workers, elapsed))
+
+
+if __name__ == '__main__':
+    main()
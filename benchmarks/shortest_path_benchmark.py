@@ -0,0 +1,52 @@
+import argparse
+import time
+
+import algabra.algorithms.graph as graphsalgs
+import algabra.datastructures.graph as mygraph
+import algabra.datastructures.heap as myheap
+import benchmarks.generators as generators
+
+HEAP_TYPES = [
+    myheap.IndexedMinHeap, myheap.MinFibonacciHeap, myheap.MinPairingHeap
+]
+MONOTONE_HEAP_TYPES = [myheap.RadixHeap]
+
+
+def measure(algorithm, *arguments) -> float:
+    started = time.perf_counter()
+    algorithm(*arguments)
+
+    return time.perf_counter() - started
+
+
+def report(name: str, graph: mygraph.CSRGraph) -> None:
+    print('%s: %d vertices, %d edges' %
+          (name, len(graph), len(graph.get_targets())))
+    source = graph.get_vertex_at(0)
+    for heap_type in HEAP_TYPES:
+        print('  %-16s dijkstra %.3fs  prim %.3fs' %
+              (heap_type.__name__,
+               measure(graphsalgs.dijkstra, graph, source, heap_type),
+               measure(graphsalgs.prim, graph, heap_type)))
+    for heap_type in MONOTONE_HEAP_TYPES:
+        print('  %-16s dijkstra %.3fs' %
+              (heap_type.__name__,
+               measure(graphsalgs.dijkstra, graph, source, heap_type)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--grid-side', type=int, default=500)
+    parser.add_argument('--dense-vertices', type=int, default=1000)
+    arguments = parser.parse_args()
+
+    report('sparse grid',
+           mygraph.CSRGraph.from_edges(generators.grid_edges(
+               arguments.grid_side)))
+    report('dense',
+           mygraph.CSRGraph.from_edges(
+               generators.dense_edges(arguments.dense_vertices)))
+
+
+if __name__ == '__main__':
+    main()
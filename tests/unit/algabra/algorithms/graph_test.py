@@ -1,8 +1,14 @@
+import os
+import random
+import tempfile
 import typing
 import unittest
 
+import numpy
+
 import algabra.algorithms.graph as graphsalgs
 import algabra.datastructures.graph as mygraph
+import algabra.datastructures.heap as myheap
 
 
 def _connect_every_vertex(graph: mygraph.GraphInterface,
@@ -59,6 +65,74 @@ class BreadthFirstSearchTestCase(unittest.TestCase):
                                            graph.get_vertex(54))
         assert no_path.is_empty()
 
+    def test_search_shortest_path_csr(self) -> None:
+        graph = mygraph.CSRGraph.from_edges(
+            [(0, 1), (1, 2), (2, 3), (0, 4), (4, 3), (3, 5)],
+            graphsalgs.BFSVertex)
+
+        shortest_path = graphsalgs.shortest_path(graph, graph.get_vertex(0),
+                                                 graph.get_vertex(5))
+        assert [v.get_key() for v in shortest_path] == [0, 4, 3, 5]
+
+    def test_bidirectional_shortest_path(self) -> None:
+        edges = [(0, 1), (1, 2), (2, 3), (0, 4), (4, 3), (3, 5), (6, 0)]
+        graphs = [
+            mygraph.CSRGraph.from_edges(edges),
+            mygraph.AdjacencyListGraph.from_edges(edges),
+        ]
+
+        for graph in graphs:
+            path = graphsalgs.shortest_path(graph,
+                                            graph.get_vertex(6),
+                                            graph.get_vertex(5),
+                                            bidirectional=True)
+            assert [v.get_key() for v in path] == [6, 0, 4, 3, 5]
+
+            path = graphsalgs.shortest_path(graph,
+                                            graph.get_vertex(5),
+                                            graph.get_vertex(6),
+                                            bidirectional=True)
+            assert path.is_empty()
+
+    def test_bidirectional_matches_breadth_first(self) -> None:
+        edges = [(key, (key * 7 + 3) % 60) for key in range(60)]
+        edges += [(key, (key * 11 + 1) % 60) for key in range(0, 60, 3)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+
+        for source in range(0, 60, 7):
+            start = graph.get_vertex(source)
+            expected = graphsalgs.breadth_first_traversal(graph, start)
+            for target in range(60):
+                to = graph.get_vertex(target)
+                path = graphsalgs.shortest_path(graph,
+                                                start,
+                                                to,
+                                                bidirectional=True)
+                keys = [v.get_key() for v in path]
+                if expected.get_distance(to) is None:
+                    assert keys == []
+                    continue
+
+                assert len(keys) == expected.get_distance(to) + 1
+                assert keys[0] == source and keys[-1] == target
+                for key_from, key_to in zip(keys, keys[1:]):
+                    assert graph.vertex_has_edge_with(
+                        graph.get_vertex(key_from), graph.get_vertex(key_to))
+
+    def test_shortest_path_max_hops(self) -> None:
+        edges = [(key, key + 1) for key in range(10)]
+        for bidirectional in (False, True):
+            for max_hops, expected_length in ((5, 0), (6, 7)):
+                graph = mygraph.AdjacencyListGraph.from_edges(
+                    edges, graphsalgs.BFSVertex)
+
+                path = graphsalgs.shortest_path(graph,
+                                                graph.get_vertex(0),
+                                                graph.get_vertex(6),
+                                                bidirectional=bidirectional,
+                                                max_hops=max_hops)
+                assert len(list(path)) == expected_length
+
     def test_one_node_route(self) -> None:
         graph = mygraph.AdjacencyListGraph()
         vertex = graphsalgs.BFSVertex(2)
@@ -94,6 +168,110 @@ class BreadthFirstSearchTestCase(unittest.TestCase):
         assert target.is_empty()
 
 
+class TraversalTestCase(unittest.TestCase):
+
+    def test_breadth_first_traversal(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 3), (0, 4),
+                                             (4, 3), (3, 5), (6, 0)])
+        start = graph.get_vertex(0)
+
+        first = graphsalgs.breadth_first_traversal(graph, start)
+        second = graphsalgs.breadth_first_traversal(graph, start)
+
+        assert first.get_distance(graph.get_vertex(5)) == 3
+        assert first.get_distance(graph.get_vertex(6)) is None
+        assert first.get_predecessor(graph.get_vertex(3)).get_key() == 4
+        assert first.get_predecessor(start) is None
+        assert [v.get_key() for v in first.get_path(graph.get_vertex(5))] == [
+            0, 4, 3, 5
+        ]
+        assert first.get_path(graph.get_vertex(6)).is_empty()
+        assert list(first.get_distances()) == list(second.get_distances())
+
+    def test_breadth_first_traversal_adjacency_list(self) -> None:
+        graph = mygraph.AdjacencyListGraph.from_edges([(0, 1), (1, 2)])
+
+        result = graphsalgs.breadth_first_traversal(graph, graph.get_vertex(0))
+
+        assert result.get_distance(graph.get_vertex(2)) == 2
+
+    def test_multi_source_traversal(self) -> None:
+        edges = [(key, (key * 7 + 3) % 50) for key in range(50)]
+        edges += [(key, (key + 1) % 50) for key in range(0, 50, 4)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+        sources = [graph.get_vertex(key) for key in (0, 5, 5, 17, 49)]
+
+        rows = graphsalgs.multi_source_traversal(graph, sources, batch_size=2)
+
+        assert len(rows) == len(sources)
+        for source, row in zip(sources, rows):
+            expected = graphsalgs.breadth_first_traversal(graph, source)
+            assert list(row) == list(expected.get_distances())
+
+    def test_multi_source_traversal_early_exit(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(key, key + 1)
+                                             for key in range(20)])
+        sources = [graph.get_vertex(key) for key in (0, 3, 7)]
+        targets = [graph.get_vertex(key) for key in (2, 3, 20)]
+
+        rows = graphsalgs.multi_source_traversal(graph, sources, targets)
+
+        assert rows[0][graph.get_index(targets[0])] == 2
+        assert rows[0][graph.get_index(graph.get_vertex(10))] == -1
+        assert rows[1][graph.get_index(targets[1])] == 0
+        assert rows[2][graph.get_index(targets[2])] == 13
+
+    def test_direction_optimizing_traversal(self) -> None:
+        edges = [(key, (key * 7 + 3) % 200) for key in range(200)]
+        edges += [((key * 13) % 200, key) for key in range(0, 200, 2)]
+        edges += [(0, key) for key in range(100, 140)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+        start = graph.get_vertex(0)
+        expected = graphsalgs.breadth_first_traversal(graph, start)
+
+        for alpha, beta in ((14, 24), (0.01, 1000), (1000, 0.01)):
+            result = graphsalgs.direction_optimizing_traversal(
+                graph, start, alpha, beta)
+
+            assert list(result.get_distances()) == list(
+                expected.get_distances())
+            for vertex in graph:
+                predecessor = result.get_predecessor(vertex)
+                if predecessor is not None:
+                    assert graph.vertex_has_edge_with(predecessor, vertex)
+                    assert result.get_distance(predecessor) + 1 == \
+                        result.get_distance(vertex)
+
+    def test_parallel_breadth_first_traversal(self) -> None:
+        edges = [(key, (key * 7 + 3) % 300) for key in range(300)]
+        edges += [((key * 13) % 300, key) for key in range(0, 300, 2)]
+        edges += [(0, key) for key in range(100, 140)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+        start = graph.get_vertex(0)
+        expected = graphsalgs.breadth_first_traversal(graph, start)
+
+        result = graphsalgs.parallel_breadth_first_traversal(graph,
+                                                            start,
+                                                            workers=2)
+
+        assert list(result.get_distances()) == list(expected.get_distances())
+        assert list(result.get_parents()) == list(expected.get_parents())
+
+    def test_depth_first_traversal(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (0, 3), (4, 2)])
+        v = [graph.get_vertex(key) for key in range(5)]
+
+        result = graphsalgs.depth_first_traversal(graph)
+
+        assert result.get_ascendant(v[0]) is None
+        assert result.get_ascendant(v[2]) == v[1]
+        assert result.get_ascendant(v[4]) is None
+        assert result.get_begin(v[0]) < result.get_begin(v[1])
+        assert result.get_end(v[1]) < result.get_begin(v[3])
+        assert result.get_end(v[3]) < result.get_end(v[0])
+        assert result.get_end(v[0]) < result.get_begin(v[4])
+
+
 class DepthFirstSearchTestCase(unittest.TestCase):
 
     def test_depth_first_search(self) -> None:
@@ -133,6 +311,378 @@ class DepthFirstSearchTestCase(unittest.TestCase):
         target_keys = graphsalgs.topological_sort(graph)
         assert [4, 5, 0, 1, 2, 3] == target_keys
 
+    def test_topological_sort_csr(self) -> None:
+        graph = mygraph.CSRGraph.from_edges(
+            [(1, 2), (2, 3), (0, 3), (4, 5), (5, 3)], graphsalgs.DFSVertex)
+
+        target_keys = graphsalgs.topological_sort(graph)
+        assert [4, 5, 0, 1, 2, 3] == target_keys
+
+    def test_topological_sort_csr_fails_with_cycles(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 0)],
+                                            graphsalgs.DFSVertex)
+
+        with self.assertRaises(RuntimeError):
+            graphsalgs.topological_sort(graph)
+
+
+class StronglyConnectedComponentsTestCase(unittest.TestCase):
+
+    def test_components(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 0), (2, 3),
+                                             (3, 4), (4, 3), (4, 5), (6, 6)])
+
+        components = graphsalgs.strongly_connected_components(graph)
+
+        assert len(components) == 4
+        members = sorted(
+            sorted(vertex.get_key() for vertex in component)
+            for component in components.get_members())
+        assert members == [[0, 1, 2], [3, 4], [5], [6]]
+        assert components.get_component(graph.get_vertex(0)) == \
+            components.get_component(graph.get_vertex(2))
+
+    def test_condensation(self) -> None:
+        graph = mygraph.AdjacencyListGraph.from_edges([(0, 1), (1, 0), (1, 2),
+                                                       (0, 2), (2, 3), (3, 2),
+                                                       (4, 0)])
+
+        components = graphsalgs.strongly_connected_components(graph)
+        condensation = components.get_condensation()
+
+        assert len(condensation) == len(components) == 3
+        order = [vertex.get_key() for vertex in
+                 graphsalgs.topological_order(condensation)]
+        expected = [components.get_component(graph.get_vertex(key))
+                    for key in (4, 0, 2)]
+        assert order == expected
+        assert len(condensation.get_targets()) == 2
+
+    def test_deep_chain(self) -> None:
+        count = 100000
+        edges = [(key, key + 1) for key in range(count)] + [(count, 0)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+
+        components = graphsalgs.strongly_connected_components(graph)
+
+        assert len(components) == 1
+
+
+class KahnTopologicalSortTestCase(unittest.TestCase):
+
+    def test_topological_order(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(1, 2), (2, 3), (0, 3), (4, 5),
+                                             (5, 3), (1, 6)])
+
+        keys = [vertex.get_key() for vertex in
+                graphsalgs.topological_order(graph)]
+
+        assert keys == [1, 0, 4, 2, 6, 5, 3]
+
+    def test_topological_order_is_lazy(self) -> None:
+        graph = mygraph.AdjacencyListGraph.from_edges([(0, 1), (1, 2),
+                                                       (2, 1)])
+
+        order = graphsalgs.topological_order(graph)
+
+        assert next(order).get_key() == 0
+        with self.assertRaises(graphsalgs.CycleException):
+            next(order)
+
+    def test_topological_layers(self) -> None:
+        graph = mygraph.AdjacencyListGraph.from_edges([(1, 2), (2, 3), (0, 3),
+                                                       (4, 5), (5, 3), (1, 6)])
+
+        layers = [[vertex.get_key() for vertex in layer]
+                  for layer in graphsalgs.topological_layers(graph)]
+
+        assert layers == [[1, 0, 4], [2, 6, 5], [3]]
+
+    def test_cycle_path(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 3), (3, 4),
+                                             (4, 2), (0, 5)])
+
+        with self.assertRaises(graphsalgs.CycleException) as context:
+            list(graphsalgs.topological_layers(graph))
+
+        cycle = context.exception.get_cycle()
+        assert len(cycle) == 4 and cycle[0] == cycle[-1]
+        assert {vertex.get_key() for vertex in cycle} == {2, 3, 4}
+        for vertex, adjacent in zip(cycle, cycle[1:]):
+            assert graph.vertex_has_edge_with(vertex, adjacent)
+
+
+class WeightedPathsTestCase(unittest.TestCase):
+
+    def test_dijkstra(self) -> None:
+        generator = random.Random(7)
+        edges = [(generator.randrange(40), generator.randrange(40),
+                  generator.randint(0, 20)) for _ in range(200)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+        start = graph.get_vertex(edges[0][0])
+        expected = _bellman_ford(graph, start)
+
+        for heap_type in (myheap.IndexedMinHeap, myheap.MinFibonacciHeap,
+                          myheap.MinPairingHeap, myheap.RadixHeap):
+            result = graphsalgs.dijkstra(graph, start, heap_type)
+
+            for vertex in graph:
+                assert result.get_distance(vertex) == expected.get(vertex)
+            path = list(result.get_path(graph.get_vertex(edges[-1][1])))
+            if path:
+                assert path[0] == start
+
+    def test_dijkstra_adjacency_list(self) -> None:
+        graph = mygraph.AdjacencyListGraph()
+        v = [mygraph.Vertex(key) for key in range(4)]
+        graph.add_edge(v[0], v[1], 5)
+        graph.add_edge(v[0], v[2], 1)
+        graph.add_edge(v[2], v[1], 1)
+        graph.add_edge(v[1], v[3], 2)
+
+        result = graphsalgs.dijkstra(graph, v[0])
+
+        assert result.get_distance(v[3]) == 4
+        assert [vertex.get_key() for vertex in result.get_path(v[3])] == [
+            0, 2, 1, 3
+        ]
+
+    def test_dijkstra_negative_weights(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1, -1)])
+
+        with self.assertRaises(ValueError):
+            graphsalgs.dijkstra(graph, graph.get_vertex(0))
+
+    def test_prim(self) -> None:
+        generator = random.Random(11)
+        edges = []
+        for _ in range(150):
+            key_from, key_to = generator.randrange(30), generator.randrange(30)
+            weight = generator.randint(1, 50)
+            edges += [(key_from, key_to, weight), (key_to, key_from, weight)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+
+        expected = _kruskal_weight(graph)
+        for heap_type in (myheap.IndexedMinHeap, myheap.MinFibonacciHeap,
+                          myheap.MinPairingHeap):
+            tree = graphsalgs.prim(graph, heap_type)
+
+            assert sum(weight for _, _, weight in tree) == expected
+            for vertex_from, vertex_to, _ in tree:
+                assert graph.vertex_has_edge_with(vertex_from, vertex_to)
+
+
+class LandmarksTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        generator = random.Random(3)
+        edges = [(generator.randrange(60), generator.randrange(60),
+                  generator.randint(1, 30)) for _ in range(300)]
+        edges += [(60, 61, 1), (61, 60, 2)]
+        self.edges = edges
+        self.graph = mygraph.CSRGraph.from_edges(edges)
+
+    def test_a_star_with_landmarks(self) -> None:
+        index = graphsalgs.LandmarkIndex.build(self.graph, 4)
+        assert len(index.get_landmarks()) == 4
+
+        for source in list(self.graph)[::9]:
+            expected = graphsalgs.dijkstra(self.graph, source)
+            for target in self.graph:
+                result = graphsalgs.a_star(self.graph, source, target, index)
+                assert result.get_distance(target) == expected.get_distance(
+                    target)
+                bound = index.get_lower_bound(source, target)
+                if expected.get_distance(target) is not None:
+                    assert bound <= expected.get_distance(target)
+
+    def test_a_star_with_foreign_landmarks(self) -> None:
+        index = graphsalgs.LandmarkIndex.build(self.graph, 2)
+        other = mygraph.CSRGraph.from_edges([(0, 1, 5), (1, 2, 5)])
+
+        with self.assertRaises(ValueError):
+            graphsalgs.a_star(other, other.get_vertex(0), other.get_vertex(2),
+                              index)
+
+        built = mygraph.CSRGraph.from_edges([(0, 1, 100), (1, 2, 100),
+                                             (0, 2, 500)])
+        other = mygraph.CSRGraph.from_edges([(0, 1, 1), (1, 2, 1), (0, 2, 5)])
+        index = graphsalgs.LandmarkIndex.build(built, 2)
+        with self.assertRaises(ValueError):
+            graphsalgs.a_star(other, other.get_vertex(0), other.get_vertex(2),
+                              index)
+        copy = mygraph.CSRGraph.from_edges([(0, 1, 100), (1, 2, 100),
+                                           (0, 2, 500)])
+        result = graphsalgs.a_star(copy, copy.get_vertex(0),
+                                   copy.get_vertex(2), index)
+        assert result.get_distance(copy.get_vertex(2)) == 200
+
+        source = mygraph.AdjacencyListGraph.from_edges([(0, 1), (1, 2)])
+        index = graphsalgs.LandmarkIndex.build(source, 2)
+        result = graphsalgs.a_star(source, source.get_vertex(0),
+                                   source.get_vertex(2), index)
+        assert result.get_distance(source.get_vertex(2)) == 2
+
+        source.add_edge(source.get_vertex(0), source.get_vertex(2))
+        with self.assertRaises(ValueError):
+            graphsalgs.a_star(source, source.get_vertex(0),
+                              source.get_vertex(2), index)
+
+    def test_a_star_without_landmarks(self) -> None:
+        source, target = self.graph.get_vertex(60), self.graph.get_vertex(61)
+
+        result = graphsalgs.a_star(self.graph, source, target)
+
+        assert [vertex.get_key() for vertex in result.get_path(target)] == [
+            60, 61
+        ]
+
+    def test_save_and_load(self) -> None:
+        index = graphsalgs.LandmarkIndex.build(self.graph, 3)
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            index.save(path)
+            loaded = graphsalgs.LandmarkIndex.load(self.graph, path)
+            with self.assertRaises(ValueError):
+                graphsalgs.LandmarkIndex.load(
+                    mygraph.CSRGraph.from_edges([(0, 1)]), path)
+            reweighted = mygraph.CSRGraph.from_edges([
+                (key_from, key_to, weight + 1)
+                for key_from, key_to, weight in self.edges
+            ])
+            with self.assertRaises(ValueError):
+                graphsalgs.LandmarkIndex.load(reweighted, path)
+        finally:
+            os.remove(path)
+
+        assert loaded.get_landmarks() == index.get_landmarks()
+        for vertex in list(self.graph)[::5]:
+            for target in list(self.graph)[::7]:
+                assert loaded.get_lower_bound(vertex, target) == \
+                    index.get_lower_bound(vertex, target)
+
+
+class PageRankTestCase(unittest.TestCase):
+
+    def test_matches_dense_solution(self) -> None:
+        generator = random.Random(3)
+        edges = [(generator.randrange(30), generator.randrange(30),
+                  generator.choice([1, 2, 5])) for _ in range(90)]
+        graph = mygraph.AdjacencyListGraph.from_edges(edges)
+        personalization = {0: 1, 1: 3}
+
+        for preference in (None, personalization):
+            ranks = graphsalgs.page_rank(graph,
+                                         tolerance=1e-12,
+                                         personalization=preference)
+
+            assert ranks.is_converged()
+            expected = _dense_page_rank(graph, 0.85, preference)
+            for key, rank in ranks.get_rank_map().items():
+                assert abs(rank - expected[key]) < 1e-9
+            assert abs(ranks.get_ranks().sum() - 1) < 1e-9
+
+    def test_dangling_and_symmetry(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 0), (0, 3)])
+        cycle = mygraph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 0)])
+
+        ranks = graphsalgs.page_rank(graph)
+        cycle_ranks = graphsalgs.page_rank(cycle)
+
+        assert abs(sum(ranks.get_rank_map().values()) - 1) < 1e-9
+        assert ranks.get_rank(graph.get_vertex(3)) > 0
+        for vertex in cycle:
+            assert abs(cycle_ranks.get_rank(vertex) - 1 / 3) < 1e-9
+
+    def test_warm_start(self) -> None:
+        generator = random.Random(8)
+        edges = [(generator.randrange(200), generator.randrange(200))
+                 for _ in range(1000)]
+        graph = mygraph.CSRGraph.from_edges(edges)
+        ranks = graphsalgs.page_rank(graph, tolerance=1e-8)
+
+        changed = mygraph.CSRGraph.from_edges(edges + [(0, 1), (2, 3)])
+        cold = graphsalgs.page_rank(changed, tolerance=1e-8)
+        warm = graphsalgs.page_rank(changed,
+                                    tolerance=1e-8,
+                                    initial=ranks.get_rank_map())
+
+        assert warm.get_iterations() < cold.get_iterations()
+        assert numpy.abs(warm.get_ranks() - cold.get_ranks()).sum() < 1e-6
+
+    def test_wrong_arguments(self) -> None:
+        graph = mygraph.CSRGraph.from_edges([(0, 1)])
+
+        self.assertRaises(ValueError, graphsalgs.page_rank, graph, 1.0)
+        self.assertRaises(ValueError,
+                          graphsalgs.page_rank,
+                          graph,
+                          personalization={7: 1})
+
+
+def _dense_page_rank(
+        graph: mygraph.GraphInterface, damping: float,
+        personalization: typing.Optional[typing.Dict[int, float]]
+) -> typing.Dict[int, float]:
+    keys = [vertex.get_key() for vertex in graph]
+    positions = {key: position for position, key in enumerate(keys)}
+    teleport = numpy.full(len(keys), 1 / len(keys))
+    if personalization is not None:
+        teleport = numpy.zeros(len(keys))
+        for key, value in personalization.items():
+            teleport[positions[key]] = value
+        teleport /= teleport.sum()
+
+    transitions = numpy.zeros((len(keys), len(keys)))
+    for vertex in graph:
+        row = transitions[positions[vertex.get_key()]]
+        for adjacent, weight in graph.get_weighted_adjacent(vertex):
+            row[positions[adjacent.get_key()]] += weight
+        row[:] = row / row.sum() if row.sum() else teleport
+
+    google = damping * transitions.T + (1 - damping) * teleport[:, None]
+    values, vectors = numpy.linalg.eig(google)
+    ranks = numpy.real(vectors[:, numpy.argmax(numpy.real(values))])
+
+    return dict(zip(keys, ranks / ranks.sum()))
+
+
+def _bellman_ford(graph: mygraph.GraphInterface, start: mygraph.Vertex
+                  ) -> typing.Dict[mygraph.Vertex, float]:
+    distances = {start: 0}
+    for _ in graph:
+        for vertex in graph:
+            if vertex not in distances:
+                continue
+            for adjacent, weight in graph.get_weighted_adjacent(vertex):
+                candidate = distances[vertex] + weight
+                if candidate < distances.get(adjacent, candidate + 1):
+                    distances[adjacent] = candidate
+
+    return distances
+
+
+def _kruskal_weight(graph: mygraph.GraphInterface) -> float:
+    edges = sorted((weight, vertex.get_key(), adjacent.get_key())
+                   for vertex in graph
+                   for adjacent, weight in graph.get_weighted_adjacent(vertex))
+    roots = {vertex.get_key(): vertex.get_key() for vertex in graph}
+
+    def find(key: int) -> int:
+        while roots[key] != key:
+            key = roots[key]
+        return key
+
+    total = 0
+    for weight, key_from, key_to in edges:
+        root_from, root_to = find(key_from), find(key_to)
+        if root_from != root_to:
+            roots[root_from] = root_to
+            total += weight
+
+    return total
+
 
 if __name__ == '__main__':
     unittest.main()
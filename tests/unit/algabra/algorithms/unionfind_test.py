@@ -1,5 +1,10 @@
+import os
+import random
+import tempfile
 import unittest
 
+import numpy
+
 import algabra.algorithms.unionfind as uf
 
 
@@ -28,6 +33,195 @@ class ConnectedCellsTestCase(unittest.TestCase):
 
         assert count == 29
 
+    def test_connected_cell_empty(self):
+        assert uf.connected_cell([[0, 0], [0, 0]]) == 0
+        assert uf.connected_cell([[0, 0], [0, 1]]) == 1
+
+    def test_connected_cell_values(self):
+        count = uf.connected_cell([
+            [1, 2, 1],
+            [-1, 1, 0],
+            [0, 0, 1],
+        ])
+
+        assert count == 4
+
+    def test_component_matrix_keys(self):
+        matrix = [[1] * 12 for _ in range(12)]
+        components = uf.ComponentMatrix(matrix)
+
+        assert components.require(1, 11) is not components.require(11, 1)
+
+
+class DisjointSetTestCase(unittest.TestCase):
+    def test_union_find(self):
+        components = uf.DisjointSet(10)
+
+        assert components.get_count() == 10
+        assert components.union(0, 1)
+        assert not components.union(1, 0)
+        assert components.union_many([(2, 3), (3, 4), (1, 4), (7, 8)]) == 4
+
+        assert components.get_count() == 5
+        assert components.get_size(3) == 5
+        assert components.get_size(8) == 2
+        assert components.get_max_size() == 5
+        assert components.connected(0, 4)
+        assert not components.connected(0, 7)
+        roots = components.find_many(range(10))
+        assert len(set(roots)) == 5
+        assert roots[0] == roots[2] == roots[4]
+
+    def test_long_chain(self):
+        size = 100000
+        components = uf.DisjointSet(size)
+        components.union_many((i, i + 1) for i in range(size - 1))
+
+        assert components.get_count() == 1
+        assert components.get_size(0) == size
+
+
+class IncrementalConnectivityTestCase(unittest.TestCase):
+    def test_batches(self):
+        connectivity = uf.IncrementalConnectivity(6)
+
+        assert connectivity.get_histogram() == {1: 6}
+        assert connectivity.union_many([(0, 1), (2, 3), (1, 3), (4, 4)]) == 3
+
+        assert connectivity.get_count() == 3
+        assert connectivity.get_histogram() == {4: 1, 1: 2}
+        assert connectivity.connected_many([(0, 2), (0, 4), (5, 5)]) == \
+            [True, False, True]
+        assert connectivity.get_sizes([3, 4]).tolist() == [4, 1]
+
+    def test_rollback(self):
+        generator = random.Random(5)
+        connectivity = uf.IncrementalConnectivity(50)
+        connectivity.union_many(
+            (generator.randrange(50), generator.randrange(50))
+            for _ in range(20))
+        snapshot = connectivity.snapshot()
+        state = (connectivity.get_count(), connectivity.get_histogram(),
+                 connectivity.get_max_size(),
+                 connectivity.get_sizes(range(50)).tolist(),
+                 connectivity.find_many(range(50)).tolist())
+
+        connectivity.union_many(
+            (generator.randrange(50), generator.randrange(50))
+            for _ in range(40))
+        assert connectivity.get_count() < state[0]
+        connectivity.rollback(snapshot)
+
+        assert (connectivity.get_count(), connectivity.get_histogram(),
+                connectivity.get_max_size(),
+                connectivity.get_sizes(range(50)).tolist(),
+                connectivity.find_many(range(50)).tolist()) == state
+        assert sum(size * count for size, count in
+                   connectivity.get_histogram().items()) == 50
+
+        connectivity.rollback(0)
+        assert connectivity.get_count() == 50
+        assert connectivity.get_max_size() == 1
+        self.assertRaises(IndexError, connectivity.rollback, 1)
+
+
+class LabelGridTestCase(unittest.TestCase):
+    def test_connectivity(self):
+        grid = [
+            [1, 0, 1],
+            [0, 1, 0],
+            [1, 1, 0],
+        ]
+
+        diagonal = uf.label_grid(grid, connectivity=8)
+        straight = uf.label_grid(grid, connectivity=4)
+
+        assert len(diagonal) == 1
+        assert diagonal.get_max_size() == 5
+        assert len(straight) == 3
+        assert straight.get_labels().tolist() == [
+            [1, 0, 2],
+            [0, 3, 0],
+            [3, 3, 0],
+        ]
+        assert straight.get_sizes().tolist() == [4, 1, 1, 3]
+        assert straight.get_largest() == 3
+
+    def test_matches_disjoint_set(self):
+        generator = random.Random(7)
+        for connectivity in (4, 8):
+            for _ in range(20):
+                rows, cols = generator.randint(1, 30), generator.randint(1, 30)
+                grid = numpy.array(
+                    [[int(generator.random() < 0.55) for _ in range(cols)]
+                     for _ in range(rows)])
+
+                labels = uf.label_grid(grid, connectivity).get_labels()
+
+                expected = _label_with_disjoint_set(grid, connectivity)
+                assert (labels != 0).tolist() == (grid != 0).tolist()
+                assert len(set(zip(labels.ravel(), expected))) == \
+                    len(set(labels.ravel())) == len(set(expected))
+
+    def test_empty(self):
+        labels = uf.label_grid(numpy.zeros((3, 4), dtype=bool))
+
+        assert len(labels) == 0
+        assert labels.get_max_size() == 0
+        assert labels.get_sizes().tolist() == [12]
+
+    def test_wrong_arguments(self):
+        self.assertRaises(ValueError, uf.label_grid, [[1]], 6)
+        self.assertRaises(ValueError, uf.label_grid, [1, 0, 1])
+
+
+class LabelTiledGridTestCase(unittest.TestCase):
+    def test_matches_label_grid(self):
+        generator = numpy.random.default_rng(11)
+        with tempfile.TemporaryDirectory() as directory:
+            grid_path = os.path.join(directory, 'grid')
+            labels_path = os.path.join(directory, 'labels')
+            for connectivity, workers in ((4, 1), (8, 1), (8, 2)):
+                grid = numpy.memmap(grid_path,
+                                    dtype=numpy.uint8,
+                                    mode='w+',
+                                    shape=(37, 53))
+                grid[:] = generator.random(grid.shape) < 0.55
+                grid.flush()
+
+                tiled = uf.label_tiled_grid(grid, labels_path, 8,
+                                            connectivity, workers)
+                whole = uf.label_grid(grid, connectivity)
+
+                labels = numpy.asarray(tiled.get_labels()).ravel()
+                expected = whole.get_labels().ravel()
+                assert isinstance(tiled.get_labels(), numpy.memmap)
+                assert len(tiled) == len(whole)
+                assert len(set(zip(labels, expected))) == len(whole) + 1
+                assert set(labels) == set(range(len(whole) + 1))
+                assert tiled.get_sizes().tolist() == numpy.bincount(
+                    labels).tolist()
+                assert tiled.get_max_size() == whole.get_max_size()
+                del tiled, grid
+
+
+def _label_with_disjoint_set(grid, connectivity):
+    rows, cols = grid.shape
+    components = uf.DisjointSet(rows * cols)
+    steps = [(0, 1), (1, 0)]
+    if connectivity == 8:
+        steps += [(1, 1), (1, -1)]
+    for i in range(rows):
+        for j in range(cols):
+            for di, dj in steps:
+                k, m = i + di, j + dj
+                if k < rows and 0 <= m < cols and grid[i, j] and grid[k, m]:
+                    components.union(i * cols + j, k * cols + m)
+
+    return [
+        components.find(cell) if grid.flat[cell] else -1
+        for cell in range(rows * cols)
+    ]
 
 
 if __name__ == '__main__':
@@ -1,4 +1,7 @@
 import abc
+import os
+import random
+import tempfile
 import unittest
 
 import algabra.datastructures.graph as my_graph
@@ -52,6 +55,22 @@ class BaseGraphTestCase(abc.ABC):
 
         graph.add_edge(my_graph.Vertex(666), wrong_vertex)
 
+    def test_weighted_edges(self) -> None:
+        graph = self._get_graph()
+        vertex1 = my_graph.Vertex(1)
+        vertex2 = my_graph.Vertex(2)
+        vertex3 = my_graph.Vertex(3)
+
+        graph.add_edge(vertex1, vertex2, 2.5)
+        graph.add_edge(vertex1, vertex3)
+        graph.add_edge(vertex1, vertex2, 7)
+
+        assert list(graph.get_weighted_adjacent(vertex1)) == [(vertex2, 2.5),
+                                                              (vertex3, 1)]
+        csr = my_graph.CSRGraph.from_graph(graph)
+        assert list(csr.get_weighted_adjacent(vertex1)) == [(vertex2, 2.5),
+                                                            (vertex3, 1)]
+
     @abc.abstractmethod
     def _get_graph(self) -> my_graph.GraphInterface:
         pass
@@ -62,6 +81,55 @@ class AdjacencyListGraphTestCase(BaseGraphTestCase, unittest.TestCase):
     def _get_graph(self) -> my_graph.GraphInterface:
         return my_graph.AdjacencyListGraph()
 
+    def test_from_edges(self) -> None:
+        graph = my_graph.AdjacencyListGraph.from_edges([(1, 5), (7, 1),
+                                                        (7, 5), (7, 1)])
+
+        assert [vertex.get_key() for vertex in graph] == [1, 5, 7]
+        assert graph.vertex_has_edge_with(graph.get_vertex(7),
+                                          graph.get_vertex(5))
+        assert not graph.vertex_has_edge_with(graph.get_vertex(5),
+                                              graph.get_vertex(7))
+        adjacent = graph.get_adjacent(graph.get_vertex(7))
+        assert [vertex.get_key() for vertex in adjacent] == [1, 5]
+
+    def test_from_file(self) -> None:
+        handle, path = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as edges_file:
+            edges_file.write('# source target\n1 5\n\n7,1\n7\t5\n')
+
+        try:
+            graph = my_graph.AdjacencyListGraph.from_file(
+                path, SubVertex, chunk_size=4)
+        finally:
+            os.remove(path)
+
+        assert isinstance(graph.get_vertex(7), SubVertex)
+        assert graph.vertex_has_edge_with(graph.get_vertex(1),
+                                          graph.get_vertex(5))
+        assert graph.vertex_has_edge_with(graph.get_vertex(7),
+                                          graph.get_vertex(1))
+        assert graph.vertex_has_edge_with(graph.get_vertex(7),
+                                          graph.get_vertex(5))
+
+    def test_predecessors(self) -> None:
+        graph = my_graph.AdjacencyListGraph.from_edges([(1, 2), (3, 2)])
+        vertex = graph.get_vertex(2)
+
+        assert [v.get_key() for v in graph.get_predecessors(vertex)] == [1, 3]
+
+        graph.add_edge(vertex, graph.get_vertex(3))
+        assert [v.get_key() for v in graph.get_predecessors(vertex)] == [1, 3]
+        assert list(graph.get_predecessors(graph.get_vertex(3))) == [vertex]
+
+    def test_adjacent_order(self) -> None:
+        graph = self._get_graph()
+        vertices = [my_graph.Vertex(key) for key in (3, 1, 2)]
+        for vertex in vertices + vertices:
+            graph.add_edge(vertices[0], vertex)
+
+        assert list(graph.get_adjacent(vertices[0])) == vertices
+
     def test_wrong_vertex(self) -> None:
         with self.assertRaises(my_graph.WrongVertexException):
             super().test_wrong_vertex()
@@ -76,6 +144,41 @@ class AdjacencyMatrixGraphTestCase(BaseGraphTestCase, unittest.TestCase):
     def _get_graph(self) -> my_graph.GraphInterface:
         return my_graph.AdjacencyMatrixGraph()
 
+    def test_weights_survive_growth(self) -> None:
+        graph = self._get_graph()
+        vertices = [my_graph.Vertex(key) for key in range(40)]
+        graph.add_edge(vertices[0], vertices[1], 2.5)
+        graph.add_edge(vertices[1], vertices[0])
+        for key in range(2, 40):
+            graph.add_edge(vertices[key - 1], vertices[key], key)
+
+        assert list(graph.get_weighted_adjacent(vertices[0])) == \
+            [(vertices[1], 2.5)]
+        assert list(graph.get_weighted_adjacent(vertices[1])) == \
+            [(vertices[0], 1), (vertices[2], 2)]
+        assert list(graph.get_weighted_adjacent(vertices[38])) == \
+            [(vertices[39], 39)]
+        assert list(graph.get_weighted_adjacent(my_graph.Vertex(99))) == []
+
+    def test_successors_and_predecessors(self) -> None:
+        graph = self._get_graph()
+        vertices = [my_graph.Vertex(key) for key in range(100)]
+        for vertex in vertices:
+            graph.add_vertex(vertex)
+        for key in (0, 9, 17, 64, 99):
+            graph.add_edge(vertices[42], vertices[key])
+            graph.add_edge(vertices[key], vertices[13])
+
+        assert len(graph) == 100
+        assert [v.get_key() for v in graph.get_adjacent(vertices[42])] == [
+            0, 9, 17, 64, 99
+        ]
+        assert [v.get_key() for v in graph.get_predecessors(vertices[13])] == [
+            0, 9, 17, 64, 99
+        ]
+        assert graph.vertex_has_edge_with(vertices[99], vertices[13])
+        assert not graph.vertex_has_edge_with(vertices[13], vertices[99])
+
     def test_wrong_vertex(self) -> None:
         with self.assertRaises(my_graph.WrongVertexException):
             super().test_wrong_vertex()
@@ -85,5 +188,267 @@ class AdjacencyMatrixGraphTestCase(BaseGraphTestCase, unittest.TestCase):
             super().test_wrong_edge()
 
 
+class CSRGraphTestCase(unittest.TestCase):
+
+    def test_from_edges(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 5), (7, 1), (7, 5), (5, 7)])
+
+        assert len(graph) == 3
+        assert graph.vertex_has_edge_with(graph.get_vertex(5),
+                                          graph.get_vertex(7))
+        assert graph.vertex_has_edge_with(graph.get_vertex(7),
+                                          graph.get_vertex(5))
+        assert not graph.vertex_has_edge_with(graph.get_vertex(5),
+                                              graph.get_vertex(1))
+        assert graph.get_vertex(2) is None
+
+    def test_from_graph(self) -> None:
+        source = my_graph.AdjacencyListGraph()
+        vertices = [my_graph.Vertex(key) for key in range(5)]
+        source.add_vertex(vertices[4])
+        source.add_edge(vertices[0], vertices[2])
+        source.add_edge(vertices[0], vertices[1])
+        source.add_edge(vertices[2], vertices[3])
+
+        graph = my_graph.CSRGraph.from_graph(source)
+        source.add_edge(vertices[3], my_graph.Vertex(5))
+
+        assert len(graph) == 5
+        assert list(graph) == list(source)[:5]
+        assert graph.get_vertex(4) is vertices[4]
+        assert list(graph.get_adjacent(vertices[0])) == vertices[2:0:-1]
+        assert graph.get_degree(vertices[4]) == 0
+
+    def test_cached_csr(self) -> None:
+        for source in (my_graph.AdjacencyListGraph(),
+                       my_graph.AdjacencyMatrixGraph()):
+            vertices = [my_graph.Vertex(key) for key in range(3)]
+            source.add_edge(vertices[0], vertices[1])
+
+            graph = source.get_csr()
+            assert source.get_csr() is graph
+            assert graph.get_csr() is graph
+
+            source.add_edge(vertices[1], vertices[2], 4)
+            updated = source.get_csr()
+            assert updated is not graph
+            assert list(updated.get_weighted_adjacent(vertices[1])) == \
+                [(vertices[2], 4)]
+
+            source.add_vertex(my_graph.Vertex(3))
+            assert len(source.get_csr()) == 4
+
+    def test_predecessors(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 2), (3, 2), (2, 1), (4, 2)])
+
+        predecessors = graph.get_predecessors(graph.get_vertex(2))
+        assert [vertex.get_key() for vertex in predecessors] == [1, 3, 4]
+        assert list(graph.get_predecessors(graph.get_vertex(4))) == []
+
+    def test_reversed(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 2, 3), (3, 2, 4), (2, 1, 5)])
+
+        reversed_graph = graph.get_reversed()
+
+        vertex = graph.get_vertex(2)
+        assert reversed_graph.get_vertex(2) is vertex
+        assert [(v.get_key(), weight) for v, weight in
+                reversed_graph.get_weighted_adjacent(vertex)] == [(1, 3),
+                                                                  (3, 4)]
+
+    def test_duplicate_edges(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 2), (1, 3), (1, 2)])
+
+        adjacent = graph.get_adjacent(graph.get_vertex(1))
+        assert [vertex.get_key() for vertex in adjacent] == [2, 3]
+
+    def test_weighted_from_edges(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 2, 0.5), (1, 3, 2),
+                                              (1, 2, 9), (3, 1)])
+
+        assert list(graph.get_weights()) == [0.5, 2, 1]
+        edges = graph.get_edges(graph.get_vertex(1))
+        assert [edge.get_weight() for edge in edges] == [0.5, 2]
+
+    def test_unweighted_from_edges(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 2), (1, 3)])
+
+        assert graph.get_weights() is None
+
+    def test_immutable(self) -> None:
+        graph = my_graph.CSRGraph.from_edges([(1, 2)])
+
+        with self.assertRaises(my_graph.ImmutableGraphException):
+            graph.add_vertex(my_graph.Vertex(3))
+        with self.assertRaises(my_graph.ImmutableGraphException):
+            graph.add_edge(graph.get_vertex(1), graph.get_vertex(2))
+        with self.assertRaises(my_graph.ImmutableGraphException):
+            graph.add_edge(graph.get_vertex(2), graph.get_vertex(1), 5)
+
+    def test_save_and_load(self) -> None:
+        sources = [
+            my_graph.CSRGraph.from_edges([(0, 1), (1, 2), (2, 0), (3, 1)]),
+            my_graph.CSRGraph.from_edges([(10, 5, 2.5), (5, 7, 1), (7, 10,
+                                                                    4)]),
+            my_graph.CSRGraph.from_edges([], keys=[4]),
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.bin')
+            for source in sources:
+                source.save(path)
+
+                graph = my_graph.CSRGraph.load(path, SubVertex)
+
+                assert len(graph) == len(source)
+                assert [vertex.get_key() for vertex in graph] == \
+                    [vertex.get_key() for vertex in source]
+                assert isinstance(graph.get_vertex_at(0), SubVertex)
+                assert graph.get_vertex(99) is None
+                assert list(graph.get_offsets()) == list(source.get_offsets())
+                assert list(graph.get_targets()) == list(source.get_targets())
+                assert list(graph.get_reversed().get_targets()) == \
+                    list(source.get_reversed().get_targets())
+                for vertex in source:
+                    loaded = graph.get_vertex(vertex.get_key())
+                    assert loaded is graph.get_vertex(vertex.get_key())
+                    assert [(adjacent.get_key(), weight)
+                            for adjacent, weight in
+                            graph.get_weighted_adjacent(loaded)] == \
+                        [(adjacent.get_key(), weight)
+                         for adjacent, weight in
+                         source.get_weighted_adjacent(vertex)]
+                    assert sorted(predecessor.get_key()
+                                  for predecessor in
+                                  graph.get_predecessors(loaded)) == \
+                        sorted(predecessor.get_key()
+                               for predecessor in
+                               source.get_predecessors(vertex))
+                del graph, loaded
+
+    def test_save_other_backends(self) -> None:
+        source = my_graph.AdjacencyListGraph.from_edges([(3, 1), (1, 2, 5)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.bin')
+            source.save(path)
+
+            graph = my_graph.CSRGraph.load(path)
+
+            assert graph.vertex_has_edge_with(graph.get_vertex(3),
+                                              graph.get_vertex(1))
+            assert list(graph.get_weighted_adjacent(
+                graph.get_vertex(1)))[0][1] == 5
+            with self.assertRaises(my_graph.ImmutableGraphException):
+                graph.add_vertex(my_graph.Vertex(4))
+            del graph
+
+    def test_load_sorted_keys(self) -> None:
+        generator = random.Random(5)
+        int_keys = list({generator.randrange(-2**62, 2**62): None
+                         for _ in range(200)})
+        str_keys = ['k%d' % key for key in int_keys] + ['é', 'z', 'Ω', '']
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.bin')
+            for keys, missing in ((int_keys, [0, 2**63, 'k1', 1.5]),
+                                  (str_keys, ['k', 'é ', 7, b'z'])):
+                my_graph.CSRGraph.from_edges(zip(keys, keys[1:])).save(path)
+
+                graph = my_graph.CSRGraph.load(path)
+
+                index = graph.get_vertex_index()
+                for vertex_id, key in enumerate(keys):
+                    assert index.get_id(key) == vertex_id
+                    assert graph.get_vertex(key).get_key() == key
+                for key in missing:
+                    assert key not in index
+                    assert graph.get_vertex(key) is None
+                assert index.get_ids(keys[:3] + missing[:1]).tolist() == \
+                    [0, 1, 2, -1]
+                del graph, index
+
+    def test_load_wrong_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.bin')
+            with open(path, 'wb') as graph_file:
+                graph_file.write(b'not a graph file at all')
+
+            self.assertRaises(ValueError, my_graph.CSRGraph.load, path)
+
+
+class VertexIndexTestCase(unittest.TestCase):
+
+    def test_ids(self) -> None:
+        index = my_graph.VertexIndex()
+        vertices = [my_graph.Vertex(key) for key in ('a', 2**62, ('x', 1))]
+
+        assert [index.add(vertex) for vertex in vertices] == [0, 1, 2]
+        assert index.add(my_graph.Vertex('a')) == 0
+        assert len(index) == 3
+        assert 2**62 in index
+        assert 'b' not in index
+        assert index.get_id(('x', 1)) == 2
+        assert index.get_ids(['a', 'b', 2**62]).tolist() == [0, -1, 1]
+        assert index.get_vertex(1) is vertices[1]
+        assert index.get_key(0) == 'a'
+        assert list(index.get_keys()) == ['a', 2**62, ('x', 1)]
+        assert index.find_vertex('b') is None
+        assert list(index) == vertices
+        with self.assertRaises(my_graph.WrongVertexException):
+            index.require(my_graph.Vertex('a'))
+
+    def test_copy(self) -> None:
+        index = my_graph.VertexIndex()
+        index.add(my_graph.Vertex('a'))
+
+        copy = index.copy()
+        index.add(my_graph.Vertex('b'))
+
+        assert len(copy) == 1
+        assert copy.get_id('b') is None
+        assert copy.get_vertex(0) is index.get_vertex(0)
+
+    def test_from_keys(self) -> None:
+        index = my_graph.VertexIndex.from_keys(['b', 'a'], SubVertex)
+
+        assert index.get_id('a') == 1
+        assert index.get_id('c') is None
+        assert isinstance(index.get_vertex(0), SubVertex)
+        assert index.get_vertex(0) is index.find_vertex('b')
+        with self.assertRaises(TypeError):
+            index.add(my_graph.Vertex('c'))
+
+    def test_string_keys(self) -> None:
+        edges = [('alice', 'bob'), ('bob', 'carol', 2), ('carol', 'alice')]
+        graphs = [
+            my_graph.AdjacencyListGraph.from_edges(edges),
+            my_graph.CSRGraph.from_edges(edges),
+        ]
+        matrix = my_graph.AdjacencyMatrixGraph()
+        for edge in edges:
+            matrix.add_edge(matrix.get_vertex(edge[0]) or
+                            my_graph.Vertex(edge[0]),
+                            matrix.get_vertex(edge[1]) or
+                            my_graph.Vertex(edge[1]), *edge[2:])
+        graphs.append(matrix)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'graph.bin')
+            graphs[1].save(path)
+            graphs.append(my_graph.CSRGraph.load(path))
+
+            for graph in graphs:
+                bob = graph.get_vertex('bob')
+                assert [(vertex.get_key(), weight) for vertex, weight in
+                        graph.get_weighted_adjacent(bob)] == [('carol', 2)]
+                assert [vertex.get_key()
+                        for vertex in graph.get_predecessors(bob)] == \
+                    ['alice']
+                assert graph.get_vertex_index().get_id('carol') == 2
+            del graphs, bob
+
+
+class SubVertex(my_graph.Vertex):
+    pass
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -90,6 +90,221 @@ class HeapTestCase(unittest.TestCase):
         max_heap.extract_highest()
         assert max_heap.get_highest() == 100
 
+    def test_key_function(self) -> None:
+        words = ['pear', 'fig', 'banana', 'kiwi', 'apple']
+        heap = my_heap.MinHeap(words, key=len)
+
+        assert heap.get_highest() == 'fig'
+        assert heap.get_highest_priority() == 3
+        heap.insert('ab')
+        assert len(heap) == 6
+        assert [len(word) for word in _get_sorted_by_extracting(heap)] == \
+            [2, 3, 4, 4, 5, 6]
+        assert my_heap.MaxHeap.get_sorted_list(words, key=len)[-1] == 'banana'
+
+    def test_payloads(self) -> None:
+        heap = my_heap.MaxHeap()
+        for priority, task in [(3, 'c'), (7, 'a'), (5, 'b'), (1, 'd')]:
+            heap.push(priority, task)
+
+        assert heap.get_highest() == 'a'
+        position = next(position for position in range(len(heap))
+                        if heap.get_payload(position) == 'd')
+        heap.promote_key(position, 9)
+        assert heap.get_payload(0) == 'd'
+        assert heap.get_value(0) == 9
+        assert _get_sorted_by_extracting(heap) == ['d', 'a', 'b', 'c']
+
+    def test_promote_key_keeps_keyed_payload(self) -> None:
+        heap = my_heap.MinHeap(key=lambda value: value % 100)
+        heap.insert(5)
+        heap.insert(130)
+        heap.promote_key(0, 1)
+        assert heap.get_payload(0) == 5
+        assert heap.get_value(0) == 1
+
+        heap = my_heap.MinHeap()
+        heap.push(5, 5)
+        heap.promote_key(0, 1)
+        assert heap.get_payload(0) == 5
+
+        heap = my_heap.MinHeap([5, 7])
+        heap.promote_key(1, 1)
+        assert heap.get_highest() == 1
+
+    def test_mixed_payloads(self) -> None:
+        heap = my_heap.MinHeap([5, 9])
+        with self.assertRaises(TypeError):
+            heap.push(7, 'job')
+        heap.promote_key(1, 1)
+        assert heap.extract_highest() == 1
+        assert heap.extract_highest() == 5
+
+        heap.push(7, 'job')
+        with self.assertRaises(TypeError):
+            heap.insert(3)
+        with self.assertRaises(TypeError):
+            heap.push_many([3])
+        assert heap.extract_highest() == 'job'
+        heap.insert(3)
+        assert heap.get_payload(0) == 3
+
+        heap = my_heap.MinHeap(key=abs)
+        heap.insert(-5)
+        heap.push(2, 'job')
+        assert _get_sorted_by_extracting(heap) == ['job', -5]
+
+    def test_insert_after_extract(self) -> None:
+        heap = my_heap.MinHeap([5, 3, 8])
+        assert heap.extract_highest() == 3
+
+        heap.insert(1)
+        heap.insert(9)
+
+        assert _get_sorted_by_extracting(heap) == [1, 5, 8, 9]
+
+
+class BulkHeapTestCase(unittest.TestCase):
+
+    def test_push_many(self) -> None:
+        generator = random.Random(2)
+        for initial, batch in ((1000, 10), (10, 1000), (0, 50)):
+            values = [generator.randrange(10000) for _ in range(initial)]
+            heap = my_heap.MinHeap(values)
+            extra = [generator.randrange(10000) for _ in range(batch)]
+
+            heap.push_many(extra)
+
+            assert len(heap) == initial + batch
+            assert heap.pop_many(20) == sorted(values + extra)[:20]
+
+    def test_pop_many(self) -> None:
+        heap = my_heap.MaxHeap(['bb', 'a', 'dddd', 'ccc'], key=len)
+
+        assert heap.pop_many(3) == ['dddd', 'ccc', 'bb']
+        assert heap.pop_many(3) == ['a']
+        assert heap.pop_many(3) == []
+
+    def test_replace_highest(self) -> None:
+        heap = my_heap.MinHeap([4, 2, 7])
+
+        assert heap.replace_highest(5) == 2
+        assert _get_sorted_by_extracting(heap) == [4, 5, 7]
+
+    def test_selection(self) -> None:
+        generator = random.Random(6)
+        values = [generator.randrange(500) for _ in range(1000)]
+
+        assert my_heap.nlargest(10, values) == sorted(values)[::-1][:10]
+        assert my_heap.nsmallest(10, values) == sorted(values)[:10]
+        assert my_heap.top_k(values, 5, key=lambda value: -value) == \
+            sorted(values)[:5]
+        assert my_heap.nlargest(5, [3, 1]) == [3, 1]
+        assert my_heap.nsmallest(0, values) == []
+
+    def test_merge(self) -> None:
+        generator = random.Random(9)
+        runs = [
+            sorted(generator.randrange(100) for _ in range(size))
+            for size in (0, 5, 30, 1, 12)
+        ]
+
+        assert list(my_heap.merge(*runs)) == sorted(sum(runs, []))
+        assert list(my_heap.merge(['bb', 'dddd'], ['a', 'ccc'],
+                                  key=len)) == ['a', 'bb', 'ccc', 'dddd']
+        assert list(my_heap.merge()) == []
+
+
+class IndexedHeapTestCase(unittest.TestCase):
+
+    def test_sort_extracting(self) -> None:
+        items_count = 100
+        heap = my_heap.IndexedMinHeap()
+        for value in random.sample(list(range(items_count)), items_count):
+            heap.insert(value)
+
+        assert _get_sorted_by_extracting(heap) == list(range(items_count))
+
+    def test_promote_handle(self) -> None:
+        items_count = 100
+        heap = my_heap.IndexedMaxHeap()
+        values = random.sample(list(range(items_count)), items_count)
+        handles = [heap.insert(value) for value in values]
+
+        heap.promote_key(handles[values.index(10)], 150)
+        assert heap.get_highest_handle() == handles[values.index(10)]
+        assert heap.extract_highest() == 150
+
+        heap.promote_key(handles[values.index(20)], 120)
+        assert heap.get_value(handles[values.index(20)]) == 120
+        assert heap.extract_highest() == 120
+        assert heap.extract_highest() == 99
+
+    def test_demote_fails(self) -> None:
+        heap = my_heap.IndexedMinHeap()
+        handle = heap.insert(5)
+
+        with self.assertRaises(TypeError):
+            heap.promote_key(handle, 6)
+
+    def test_arities(self) -> None:
+        for arity in (2, 3, 4, 8):
+            heap = my_heap.IndexedMinHeap(arity)
+            for value in random.sample(list(range(200)), 200):
+                heap.insert(value)
+
+            assert _get_sorted_by_extracting(heap) == list(range(200))
+
+        with self.assertRaises(ValueError):
+            my_heap.IndexedMinHeap(1)
+
+    def test_delete_and_contains(self) -> None:
+        generator = random.Random(4)
+        heap = my_heap.IndexedMinHeap()
+        alive = dict()
+        for _ in range(2000):
+            operation = generator.random()
+            if operation < 0.5 or not alive:
+                value = generator.randrange(1000)
+                alive[heap.insert(value)] = value
+            elif operation < 0.7:
+                handle = generator.choice(list(alive))
+                assert heap.delete(handle) == alive.pop(handle)
+                assert handle not in heap
+            elif operation < 0.85:
+                handle = generator.choice(list(alive))
+                alive[handle] -= generator.randrange(1, 100)
+                heap.promote_key(handle, alive[handle])
+            else:
+                assert heap.get_highest() == min(alive.values())
+                handle = heap.get_highest_handle()
+                assert heap.extract_highest() == alive.pop(handle)
+                assert not heap.contains(handle)
+
+            assert len(heap) == len(alive)
+            assert all(heap.contains(handle) for handle in alive)
+
+        assert not heap.contains(-1)
+        with self.assertRaises(KeyError):
+            heap.delete(next(iter(set(range(3000)) - set(alive))))
+        assert _get_sorted_by_extracting(heap) == sorted(alive.values())
+
+    def test_released_handles(self) -> None:
+        heap = my_heap.IndexedMinHeap()
+        handles = set()
+        for value in range(1000):
+            handles.add(heap.insert(value))
+            heap.insert(value + 1)
+            heap.extract_highest()
+            heap.delete(heap.get_highest_handle())
+
+        assert len(heap) == 0
+        assert len(heap._positions) == 2
+        assert len(handles) == 1000
+        assert not any(heap.contains(handle) for handle in handles)
+        with self.assertRaises(KeyError):
+            heap.get_value(0)
+
 
 class FibonacciHeapTestCase(unittest.TestCase):
 
@@ -173,6 +388,19 @@ class FibonacciHeapTestCase(unittest.TestCase):
         target_list = _get_sorted_by_extracting(heap)
         assert target_list.count(target_node._key) == 0
 
+    def test_small_heaps(self) -> None:
+        for items_count in range(1, 20):
+            heap = my_heap.MinFibonacciHeap()
+            for value in range(items_count, 0, -1):
+                heap.insert(my_heap.FibonacciHeapNode(value))
+
+            assert _get_sorted_by_extracting(heap) == \
+                list(range(1, items_count + 1))
+
+    def test_random_operations(self) -> None:
+        _check_random_operations(my_heap.MinFibonacciHeap,
+                                 my_heap.FibonacciHeapNode)
+
     def _extract_promote_sequences(self, heap, items_count):
         values = random.sample(list(range(items_count)), items_count)
         nodes_collection = [my_heap.FibonacciHeapNode(i) for i in values]
@@ -191,6 +419,173 @@ class FibonacciHeapTestCase(unittest.TestCase):
                 extract = True
 
 
+class PairingHeapTestCase(unittest.TestCase):
+
+    def test_sort(self) -> None:
+        items_count = 200
+        values = random.sample(list(range(items_count)), items_count)
+        min_heap = my_heap.MinPairingHeap()
+        max_heap = my_heap.MaxPairingHeap()
+        for value in values:
+            min_heap.insert(my_heap.PairingHeapNode(value))
+            max_heap.insert(my_heap.PairingHeapNode(value))
+
+        assert min_heap.get_highest() == 0
+        assert _get_sorted_by_extracting(min_heap) == list(range(items_count))
+        assert _get_sorted_by_extracting(max_heap) == \
+            list(range(items_count - 1, -1, -1))
+        assert min_heap.extract_highest() is None
+
+    def test_union(self) -> None:
+        one = my_heap.MinPairingHeap()
+        other = my_heap.MinPairingHeap()
+        for value in range(50):
+            (one if value % 3 else other).insert(my_heap.PairingHeapNode(value))
+
+        target = my_heap.MinPairingHeap.union(one, other)
+
+        assert len(target) == 50
+        assert _get_sorted_by_extracting(target) == list(range(50))
+
+    def test_random_operations(self) -> None:
+        _check_random_operations(my_heap.MinPairingHeap,
+                                 my_heap.PairingHeapNode)
+
+    def test_missing_nodes(self) -> None:
+        heap = my_heap.MinPairingHeap()
+        nodes = [my_heap.PairingHeapNode(value) for value in (10, 20, 30)]
+        for node in nodes:
+            heap.insert(node)
+        assert heap.extract_highest_node() is nodes[0]
+        heap.delete(nodes[2])
+
+        for node in (nodes[0], nodes[2], my_heap.PairingHeapNode(40)):
+            with self.assertRaises(KeyError):
+                heap.delete(node)
+            with self.assertRaises(KeyError):
+                heap.promote_key(node, 5)
+        assert len(heap) == 1
+        assert heap.extract_highest() == 20
+
+
+class RadixHeapTestCase(unittest.TestCase):
+
+    def test_sort(self) -> None:
+        heap = my_heap.RadixHeap()
+        values = [random.randrange(1 << 40) for _ in range(300)] + [0, 0, 7]
+        for value in values:
+            heap.insert(my_heap.RadixHeapNode(value))
+
+        assert heap.get_highest() == 0
+        assert _get_sorted_by_extracting(heap) == sorted(values)
+        assert heap.get_highest() is None
+
+    def test_monotone_operations(self) -> None:
+        generator = random.Random(21)
+        heap = my_heap.RadixHeap()
+        alive = set()
+        last = 0
+        for _ in range(3000):
+            operation = generator.random()
+            if operation < 0.4 or not alive:
+                node = my_heap.RadixHeapNode(last + generator.randrange(1000))
+                heap.insert(node)
+                alive.add(node)
+            elif operation < 0.65:
+                node = generator.choice(list(alive))
+                if heap.get_value(node) > last:
+                    heap.promote_key(node, generator.randrange(
+                        last, heap.get_value(node)))
+            elif operation < 0.75:
+                node = generator.choice(list(alive))
+                heap.delete(node)
+                alive.remove(node)
+            else:
+                node = heap.extract_highest_node()
+                assert node in alive
+                assert heap.get_value(node) == min(
+                    heap.get_value(other) for other in alive)
+                assert heap.get_value(node) >= last
+                last = heap.get_value(node)
+                alive.remove(node)
+
+            assert len(heap) == len(alive)
+
+    def test_wrong_keys(self) -> None:
+        heap = my_heap.RadixHeap()
+        node = my_heap.RadixHeapNode(10)
+        heap.insert(node)
+        heap.insert(my_heap.RadixHeapNode(20))
+        heap.extract_highest()
+
+        with self.assertRaises(ValueError):
+            heap.insert(my_heap.RadixHeapNode(5))
+        with self.assertRaises(ValueError):
+            heap.insert(my_heap.RadixHeapNode(12.5))
+        with self.assertRaises(ValueError):
+            heap.insert(my_heap.RadixHeapNode(-1))
+        assert len(heap) == 1
+
+    def test_missing_nodes(self) -> None:
+        heap = my_heap.RadixHeap()
+        first = my_heap.RadixHeapNode(10)
+        heap.insert(first)
+        heap.insert(my_heap.RadixHeapNode(20))
+        assert heap.extract_highest_node() is first
+
+        with self.assertRaises(KeyError):
+            heap.delete(first)
+        with self.assertRaises(KeyError):
+            heap.promote_key(first, 15)
+        with self.assertRaises(KeyError):
+            heap.delete(my_heap.RadixHeapNode(30))
+        assert len(heap) == 1
+        assert heap.extract_highest() == 20
+
+    def test_union(self) -> None:
+        one = my_heap.RadixHeap()
+        other = my_heap.RadixHeap()
+        for value in range(40):
+            (one if value % 2 else other).insert(my_heap.RadixHeapNode(value))
+        one.extract_highest()
+
+        target = my_heap.RadixHeap.union(one, other)
+
+        assert len(target) == 39
+        assert _get_sorted_by_extracting(target) == \
+            sorted(list(range(0, 40, 2)) + list(range(3, 40, 2)))
+
+
+def _check_random_operations(heap_type, node_type) -> None:
+    generator = random.Random(12)
+    heap = heap_type()
+    alive = set()
+    for _ in range(3000):
+        operation = generator.random()
+        if operation < 0.45 or not alive:
+            node = node_type(generator.randrange(10000))
+            heap.insert(node)
+            alive.add(node)
+        elif operation < 0.7:
+            node = generator.choice(list(alive))
+            heap.promote_key(node, node._key - generator.randrange(1, 500))
+        elif operation < 0.8:
+            node = generator.choice(list(alive))
+            heap.delete(node)
+            alive.remove(node)
+        else:
+            expected = min(node._key for node in alive)
+            assert heap.get_highest() == expected
+            node = heap.extract_highest_node()
+            assert heap.get_value(node) == expected
+            alive.remove(node)
+
+        assert len(heap) == len(alive)
+
+    assert _get_sorted_by_extracting(heap) == \
+        sorted(node._key for node in alive)
+
+
 def _get_sorted_by_extracting(heap: my_heap.AbstractHeap) -> list:
     target_list = []
     max_item = heap.extract_highest()